@@ -8,31 +8,40 @@ import os
 import sys
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def install_pyinstaller():
-    """Install PyInstaller if not already installed"""
+    """Install PyInstaller if not already installed, upgrading versions before 6.6 (needed for optimize=2)"""
     try:
         import PyInstaller
-        print("✅ PyInstaller is already installed")
-        return True
+        version = tuple(int(part) for part in PyInstaller.__version__.split('.')[:2] if part.isdigit())
+        if version >= (6, 6):
+            print("✅ PyInstaller is already installed")
+            return True
+        print(f"📦 PyInstaller {PyInstaller.__version__} is older than 6.6, upgrading...")
     except ImportError:
         print("📦 Installing PyInstaller...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-            print("✅ PyInstaller installed successfully")
-            return True
-        except subprocess.CalledProcessError:
-            print("❌ Failed to install PyInstaller")
-            return False
+    
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pyinstaller>=6.6"])
+        print("✅ PyInstaller installed successfully")
+        return True
+    except subprocess.CalledProcessError:
+        print("❌ Failed to install PyInstaller")
+        return False
 
 def clean_build_dirs():
     """Clean previous build directories"""
-    dirs_to_clean = ["build", "dist", "__pycache__"]
-    for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
-            print(f"🧹 Cleaning {dir_name}...")
-            shutil.rmtree(dir_name)
+    dirs_to_clean = {"build", "dist", "__pycache__"}
+    existing_dirs = [entry.name for entry in os.scandir(".")
+                     if entry.name in dirs_to_clean and entry.is_dir()]
+    for dir_name in existing_dirs:
+        print(f"🧹 Cleaning {dir_name}...")
+    
+    # Deleting many small files is latency-bound, so remove the trees in parallel
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        executor.map(lambda dir_name: shutil.rmtree(dir_name, ignore_errors=True), existing_dirs)
     
     # Clean spec file if exists
     spec_file = "OBJ_Model_Processor.spec"
@@ -45,8 +54,15 @@ def create_spec_file():
     spec_content = '''
 # -*- mode: python ; coding: utf-8 -*-
 
+import os
+import sys
+
 block_cipher = None
 
+# Strip debug symbols from collected binaries on platforms that ship a strip tool
+# (PyInstaller does not recommend stripping on Windows)
+strip_binaries = not sys.platform.startswith('win')
+
 a = Analysis(
     ['main.py'],
     pathex=[],
@@ -54,42 +70,53 @@ a = Analysis(
     datas=[
         ('PyQt6MD3Guide', 'PyQt6MD3Guide'),
     ],
+    # Only modules main.py actually uses; numpy and the rest of PyOpenGL are
+    # picked up by PyInstaller's own hooks, and GLUT is never used
     hiddenimports=[
         'PyQt6.QtOpenGLWidgets',
         'PyQt6.QtOpenGL',
-        'OpenGL',
         'OpenGL.GL',
         'OpenGL.GLU',
-        'OpenGL.GLUT',
-        'numpy',
-        'numpy.core._multiarray_umath',
     ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Stdlib/tooling modules the app never imports; keeps the bundle small
+    excludes=[
+        'tkinter',
+        'unittest',
+        'pydoc',
+        'xmlrpc',
+        'test',
+        'distutils',
+        'setuptools',
+        'pip',
+        'doctest',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    optimize=2,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# One-folder build: binaries and data are collected next to the exe instead of
+# being unpacked to a temp directory on every launch
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='OBJ Model Processor',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    strip=strip_binaries,
+    # UPX adds a decompression pass on every launch; keep DLLs that break when
+    # compressed excluded in case it is turned back on
+    upx=False,
+    upx_exclude=['vcruntime140.dll', 'python3*.dll', 'Qt6*.dll'],
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -99,6 +126,17 @@ exe = EXE(
     icon='icon.ico' if os.path.exists('icon.ico') else None,
     version='version_info.txt' if os.path.exists('version_info.txt') else None,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=strip_binaries,
+    upx=False,
+    upx_exclude=['vcruntime140.dll', 'python3*.dll', 'Qt6*.dll'],
+    name='OBJ Model Processor',
+)
 '''
     
     with open("OBJ_Model_Processor.spec", "w", encoding="utf-8") as f:
@@ -166,17 +204,20 @@ def build_executable():
         cmd = [sys.executable, "-m", "PyInstaller", "OBJ_Model_Processor.spec", "--clean"]
         
         print(f"🚀 Running command: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        print("\n📦 Build output:")
+        
+        # Stream PyInstaller output as it arrives instead of buffering all of it
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   text=True, bufsize=1)
+        for line in process.stdout:
+            print(line, end='')
+        returncode = process.wait()
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Build completed successfully!")
-            print("\n📦 Build output:")
-            print(result.stdout)
             return True
         else:
             print("❌ Build failed!")
-            print("Error output:")
-            print(result.stderr)
             return False
             
     except Exception as e:
@@ -278,24 +319,24 @@ def main():
     print("\n" + "=" * 50)
     print("🎉 Build completed successfully!")
     print("\n📁 Output location:")
-    print(f"   dist/OBJ Model Processor.exe")
+    print(f"   dist/OBJ Model Processor/OBJ Model Processor.exe")
     print("\n📋 What was created:")
-    print("   ✅ Standalone executable (no Python required)")
+    print("   ✅ Standalone application folder (no Python required)")
     print("   ✅ Includes all dependencies")
     print("   ✅ Material Design 3 guide included")
     print("   ✅ Version info embedded")
     print("   ✅ Windows executable with icon support")
     
     # Check if executable exists
-    exe_path = Path("dist/OBJ Model Processor.exe")
+    exe_path = Path("dist/OBJ Model Processor/OBJ Model Processor.exe")
     if exe_path.exists():
         size_mb = exe_path.stat().st_size / (1024 * 1024)
         print(f"\n📊 Executable size: {size_mb:.1f} MB")
         print(f"📂 Full path: {exe_path.absolute()}")
     
     print("\n🚀 To run the executable:")
-    print("   Double-click: dist/OBJ Model Processor.exe")
-    print("   Or run from command line: dist\\'OBJ Model Processor.exe'")
+    print("   Double-click: dist/OBJ Model Processor/OBJ Model Processor.exe")
+    print('   Or run from command line: "dist\\OBJ Model Processor\\OBJ Model Processor.exe"')
     
     print("\n📦 Optional: Create installer")
     print("   If you have NSIS installed, run: makensis installer.nsi")
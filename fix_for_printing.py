@@ -1,17 +1,57 @@
 import sys
 import os
-import numpy as np
-from obj_model_processor import OBJParser
+import itertools
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
-def analyze_object_bounds(obj_file_path):
-    """Analyze the bounding box of an OBJ file"""
-    parser = OBJParser()
-    parser.parse_file(obj_file_path)
-    
-    if not parser.vertices:
-        return None
+# numpy and OBJParser are imported inside the functions that need them so the
+# usage/help path starts without paying their import cost
+
+# Output buffer size and how many face lines are collected per write
+WRITE_BUFFER_SIZE = 1 << 20
+FACE_WRITE_BATCH = 8192
+
+@contextmanager
+def open_atomic(output_path):
+    """Write to a '.part' file that replaces output_path only once fully written"""
+    part_path = Path(f"{output_path}.part")
+    try:
+        with open(part_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        os.replace(part_path, output_path)
+    except BaseException:
+        # Never leave a truncated OBJ behind
+        part_path.unlink(missing_ok=True)
+        raise
+
+def read_vertex_lines(obj_file_path):
+    """Yield only the geometric vertex ('v') lines of an OBJ file"""
+    with open(obj_file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('v '):
+                yield line
+
+def analyze_object_bounds(obj_file_path, parser=None):
+    """Analyze the bounding box of an OBJ file (reuses an already parsed file if given)"""
+    import numpy as np
     
-    vertices = np.array(parser.vertices)
+    if parser is not None:
+        if len(parser.vertices) == 0:
+            return None
+        vertices = np.asarray(parser.vertices, dtype=np.float32)
+    else:
+        # Only vertex lines are needed, so skip the full parse of faces/normals/texcoords
+        vertex_lines = read_vertex_lines(obj_file_path)
+        try:
+            first_line = next(vertex_lines, None)
+            if first_line is None:
+                return None
+            vertices = np.loadtxt(itertools.chain([first_line], vertex_lines),
+                                  usecols=(1, 2, 3), ndmin=2, dtype=np.float32)
+        except (OSError, ValueError) as e:
+            print(f"Error reading vertices: {e}")
+            return None
     
     min_bounds = np.min(vertices, axis=0)
     max_bounds = np.max(vertices, axis=0)
@@ -27,15 +67,17 @@ def analyze_object_bounds(obj_file_path):
 
 def recenter_to_ground(obj_file_path, output_path):
     """Recenter object so it sits on the ground plane (Z=0) and is centered at origin"""
+    import numpy as np
+    from obj_model_processor import OBJParser
     
     parser = OBJParser()
     parser.parse_file(obj_file_path)
     
-    if not parser.vertices:
+    if len(parser.vertices) == 0:
         print("No vertices found in file")
         return False
     
-    vertices = np.array(parser.vertices)
+    vertices = np.asarray(parser.vertices, dtype=np.float32)
     
     # Find minimum Z value (lowest point)
     min_z = np.min(vertices[:, 2])
@@ -45,148 +87,246 @@ def recenter_to_ground(obj_file_path, output_path):
     center_y = np.mean(vertices[:, 1])
     
     # Apply transformation: center X,Y and move Z so lowest point is at 0
-    transformed_vertices = []
-    for v in vertices:
-        new_v = (
-            v[0] - center_x,  # Center X
-            v[1] - center_y,  # Center Y
-            v[2] - min_z      # Move to ground
-        )
-        transformed_vertices.append(new_v)
+    offset = np.array([center_x, center_y, min_z], dtype=vertices.dtype)
+    transformed_vertices = vertices - offset
+    
+    # Convert texture coordinates and normals once for the bulk writer
+    texture_coords = np.asarray(parser.texture_coords, dtype=np.float32)
+    normals = np.asarray(parser.normals, dtype=np.float32)
     
     # Write the corrected OBJ file
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with open_atomic(output_path) as f:
         f.write(f"# Fixed for 3D printing from: {obj_file_path}\n")
         f.write(f"# Recentered to ground and centered at origin\n")
         f.write(f"# Original vertices: {len(transformed_vertices)}\n\n")
         
         # Write transformed vertices
-        for v in transformed_vertices:
-            f.write(f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n")
+        np.savetxt(f, transformed_vertices, fmt="v %.6f %.6f %.6f")
         
         # Write texture coordinates if any
-        if parser.texture_coords:
+        if len(texture_coords):
             f.write("\n")
-            for vt in parser.texture_coords:
-                f.write(f"vt {vt[0]:.6f} {vt[1]:.6f}\n")
+            np.savetxt(f, texture_coords, fmt="vt %.6f %.6f")
         
         # Write normals if any
-        if parser.normals:
+        if len(normals):
             f.write("\n")
-            for vn in parser.normals:
-                f.write(f"vn {vn[0]:.6f} {vn[1]:.6f} {vn[2]:.6f}\n")
+            np.savetxt(f, normals, fmt="vn %.6f %.6f %.6f")
         
         # Write faces (no need to remap since we kept all vertices)
         f.write("\n")
         f.write("o FixedObject\n")
-        for face in parser.faces:
-            f.write(f"f {' '.join(face)}\n")
+        f.write("".join(["f " + " ".join(face) + "\n" for face in parser.faces]))
     
     print(f"Fixed object saved to: {output_path}")
     print(f"  Translation: X={-center_x:.3f}, Y={-center_y:.3f}, Z={-min_z:.3f}")
     return True
 
-def fix_obj_for_printing(obj_file_path, output_path=None):
-    """Fix common OBJ issues for 3D printing software compatibility"""
+def parse_vertex_refs(vertex_refs):
+    """Convert face vertex index strings to an int array, using 0 for malformed entries"""
+    import numpy as np
+    
+    try:
+        return np.array(vertex_refs, dtype=str).astype(np.int64)
+    except (ValueError, OverflowError):
+        # Fall back to per-token conversion only when some token is not an integer
+        indices = np.zeros(len(vertex_refs), dtype=np.int64)
+        for i, vertex_ref in enumerate(vertex_refs):
+            try:
+                indices[i] = int(vertex_ref)
+            except (ValueError, OverflowError):
+                pass
+        return indices
+
+# Face vertex token rewriters; each takes the vertex index string, the remainder
+# after the first '/', and the original token
+def format_vertex_only(vertex_ref, rest, vertex_data):
+    """Simple vertex-only format"""
+    return vertex_ref
+
+def format_vertex_texture(vertex_ref, rest, vertex_data):
+    """vertex/texture format"""
+    tex_end = rest.find('/')
+    if tex_end == 0 or not rest:
+        return vertex_ref
+    # Slice the original token instead of rebuilding "v/vt"
+    return vertex_data if tex_end == -1 else vertex_data[:len(vertex_ref) + 1 + tex_end]
+
+def format_vertex_normal(vertex_ref, rest, vertex_data):
+    """vertex//normal format"""
+    if rest.startswith('/'):
+        # Already "v//vn", possibly with trailing fields to drop
+        normal_end = rest.find('/', 1)
+        if normal_end == 1 or len(rest) == 1:
+            return vertex_ref
+        return vertex_data if normal_end == -1 else vertex_data[:len(vertex_ref) + 1 + normal_end]
+    normal_ref = rest.partition('/')[2].partition('/')[0]
+    return f"{vertex_ref}//{normal_ref}" if normal_ref else vertex_ref
+
+def format_vertex_full(vertex_ref, rest, vertex_data):
+    """vertex/texture/normal format, kept unchanged"""
+    return vertex_data
+
+# (has_texcoords, has_normals) -> token rewriter
+FACE_FORMATTERS = {
+    (False, False): format_vertex_only,
+    (True, False): format_vertex_texture,
+    (False, True): format_vertex_normal,
+    (True, True): format_vertex_full,
+}
+
+def choose_face_format(has_texcoords, has_normals):
+    """Return the function that rewrites one face vertex token for the available data"""
+    return FACE_FORMATTERS[bool(has_texcoords), bool(has_normals)]
+
+def fix_obj_for_printing(obj_file_path, output_path=None, parser=None, dedupe_faces=False):
+    """Fix common OBJ issues for 3D printing software compatibility
+    
+    With dedupe_faces, repeated faces (same cleaned vertex tokens in the same order)
+    are written only once.
+    """
+    import numpy as np
+    from obj_model_processor import OBJParser
     
     if output_path is None:
         base_name = os.path.splitext(obj_file_path)[0]
         output_path = f"{base_name}_fixed.obj"
     
-    parser = OBJParser()
-    parser.parse_file(obj_file_path)
+    if parser is None:
+        parser = OBJParser()
+        parser.parse_file(obj_file_path)
     
     print(f"Processing: {obj_file_path}")
     print(f"Original vertices: {len(parser.vertices)}")
     print(f"Original faces: {len(parser.faces)}")
     
-    # First, recenter to ground
-    temp_path = output_path.replace('.obj', '_temp.obj')
-    if recenter_to_ground(obj_file_path, temp_path):
-        # Parse the recentered file
-        temp_parser = OBJParser()
-        temp_parser.parse_file(temp_path)
+    if len(parser.vertices) == 0:
+        print("No vertices found in file")
+        return False
+    
+    # Loop invariants, looked up once
+    faces = parser.faces
+    vertex_count = len(parser.vertices)
+    face_count = len(faces)
+    
+    # Recenter to ground in memory: center X,Y and move Z so lowest point is at 0
+    vertices = np.asarray(parser.vertices, dtype=np.float32)
+    min_z = np.min(vertices[:, 2])
+    center_x = np.mean(vertices[:, 0])
+    center_y = np.mean(vertices[:, 1])
+    offset = np.array([center_x, center_y, min_z], dtype=vertices.dtype)
+    transformed_vertices = vertices - offset
+    
+    # Convert texture coordinates and normals once for the bulk writer
+    texture_coords = np.asarray(parser.texture_coords, dtype=np.float32)
+    normals = np.asarray(parser.normals, dtype=np.float32)
+    
+    # Additional fixes for 3D printing software
+    with open_atomic(output_path) as f:
+        f.write(f"# 3D Printing Fixed OBJ from: {obj_file_path}\n")
+        f.write(f"# Recentered to ground, centered at origin\n")
+        f.write(f"# Vertices: {vertex_count}\n")
+        f.write(f"# Faces: {face_count}\n\n")
         
-        # Additional fixes for 3D printing software
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(f"# 3D Printing Fixed OBJ from: {obj_file_path}\n")
-            f.write(f"# Recentered to ground, centered at origin\n")
-            f.write(f"# Vertices: {len(temp_parser.vertices)}\n")
-            f.write(f"# Faces: {len(temp_parser.faces)}\n\n")
-            
-            # Write vertices with consistent formatting
-            vertex_count = 0
-            for v in temp_parser.vertices:
-                vertex_count += 1
-                # Ensure consistent decimal places and no scientific notation
-                f.write(f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n")
-            
-            # Write texture coordinates if any
-            if temp_parser.texture_coords:
-                f.write("\n")
-                for vt in temp_parser.texture_coords:
-                    f.write(f"vt {vt[0]:.6f} {vt[1]:.6f}\n")
-            
-            # Write normals if any
-            if temp_parser.normals:
-                f.write("\n")
-                for vn in temp_parser.normals:
-                    f.write(f"vn {vn[0]:.6f} {vn[1]:.6f} {vn[2]:.6f}\n")
-            
-            # Write faces with validation
+        # Write vertices with consistent formatting
+        # Ensure consistent decimal places and no scientific notation
+        np.savetxt(f, transformed_vertices, fmt="v %.6f %.6f %.6f")
+        
+        # Write texture coordinates if any
+        if len(texture_coords):
             f.write("\n")
-            f.write("o PrintableObject\n")
-            face_count = 0
-            has_normals = len(temp_parser.normals) > 0
-            has_texcoords = len(temp_parser.texture_coords) > 0
-            
-            for face in temp_parser.faces:
-                face_count += 1
-                # Validate face indices
-                valid_face = []
-                for vertex_data in face:
-                    parts = vertex_data.split('/')
-                    if parts[0]:  # Vertex index
-                        try:
-                            vertex_idx = int(parts[0])
-                            if 1 <= vertex_idx <= len(temp_parser.vertices):
-                                # Clean up face format based on available data
-                                if not has_texcoords and not has_normals:
-                                    # Simple vertex-only format
-                                    valid_face.append(parts[0])
-                                elif has_texcoords and not has_normals:
-                                    # vertex/texture format
-                                    if len(parts) > 1 and parts[1]:
-                                        valid_face.append(f"{parts[0]}/{parts[1]}")
-                                    else:
-                                        valid_face.append(parts[0])
-                                elif not has_texcoords and has_normals:
-                                    # vertex//normal format
-                                    if len(parts) > 2 and parts[2]:
-                                        valid_face.append(f"{parts[0]}//{parts[2]}")
-                                    else:
-                                        valid_face.append(parts[0])
-                                else:
-                                    # vertex/texture/normal format
-                                    valid_face.append(vertex_data)
-                        except ValueError:
-                            continue
-                
-                if len(valid_face) >= 3:  # Only write valid faces
-                    f.write(f"f {' '.join(valid_face)}\n")
-            
-            print(f"Final fixed file: {output_path}")
-            print(f"  Valid faces written: {face_count}")
+            np.savetxt(f, texture_coords, fmt="vt %.6f %.6f")
         
-        # Clean up temp file
-        try:
-            os.remove(temp_path)
-        except:
-            pass
+        # Write normals if any
+        if len(normals):
+            f.write("\n")
+            np.savetxt(f, normals, fmt="vn %.6f %.6f %.6f")
+        
+        # Write faces with validation
+        f.write("\n")
+        f.write("o PrintableObject\n")
+        has_normals = len(normals) > 0
+        has_texcoords = len(texture_coords) > 0
+        # Clean up face format based on available data
+        format_vertex = choose_face_format(has_texcoords, has_normals)
         
-        return True
+        duplicate_count = 0
+        
+        # Validate face indices for every face vertex in one vectorized pass
+        tokens = [vertex_data for face in faces for vertex_data in face]
+        split_tokens = [vertex_data.partition('/') for vertex_data in tokens]
+        vertex_indices = parse_vertex_refs([vertex_ref for vertex_ref, _, _ in split_tokens])
+        valid_mask = (vertex_indices >= 1) & (vertex_indices <= vertex_count)
+        
+        # Duplicates are only found on the cleaned lines, so deduping always takes the general path
+        if (not dedupe_faces and not has_texcoords and not has_normals and valid_mask.all()
+                and all(len(face) == 3 for face in faces)):
+            # Common case: plain triangles with no invalid indices
+            np.savetxt(f, vertex_indices.reshape(-1, 3), fmt="f %d %d %d")
+        elif not dedupe_faces and has_texcoords and has_normals and valid_mask.all():
+            # Full v/vt/vn tokens are kept unchanged, so join whole faces directly
+            f.write("".join(["f " + face_line + "\n"
+                             for face_line, face in zip(map(" ".join, faces), faces)
+                             if len(face) >= 3]))
+        else:
+            # Rewrite each distinct valid token once, faces share most of their corners
+            # and equal tokens then also share one output string
+            valid = valid_mask.tolist()
+            if format_vertex is format_vertex_full:
+                # Full v/vt/vn tokens are kept unchanged, only invalid ones are dropped
+                clean_tokens = list(itertools.compress(tokens, valid))
+            else:
+                clean_cache = {}
+                for (vertex_ref, _, rest), vertex_data in zip(itertools.compress(split_tokens, valid),
+                                                              itertools.compress(tokens, valid)):
+                    if vertex_data not in clean_cache:
+                        clean_cache[vertex_data] = format_vertex(vertex_ref, rest, vertex_data)
+                clean_tokens = list(map(clean_cache.__getitem__, itertools.compress(tokens, valid)))
+            
+            # Per-face valid token counts from face boundary offsets
+            face_lengths = np.fromiter(map(len, faces), dtype=np.intp, count=face_count)
+            valid_cumsum = np.concatenate(([0], np.cumsum(valid_mask)))
+            face_ends = np.cumsum(face_lengths)
+            valid_counts = valid_cumsum[face_ends] - valid_cumsum[face_ends - face_lengths]
+            
+            # Only write faces that keep at least 3 valid vertices
+            clean_ends = np.cumsum(valid_counts)
+            keep = valid_counts >= 3
+            face_lines = []
+            seen_lines = set()
+            for start, end in zip((clean_ends - valid_counts)[keep].tolist(), clean_ends[keep].tolist()):
+                face_line = "f " + " ".join(clean_tokens[start:end]) + "\n"
+                if dedupe_faces:
+                    if face_line in seen_lines:
+                        duplicate_count += 1
+                        continue
+                    seen_lines.add(face_line)
+                face_lines.append(face_line)
+                if len(face_lines) >= FACE_WRITE_BATCH:
+                    f.writelines(face_lines)
+                    face_lines.clear()
+            
+            f.writelines(face_lines)
+    
+    print(f"  Translation: X={-center_x:.3f}, Y={-center_y:.3f}, Z={-min_z:.3f}")
+    print(f"Final fixed file: {output_path}")
+    print(f"  Valid faces written: {face_count}")
+    if dedupe_faces:
+        print(f"  Duplicate faces skipped: {duplicate_count}")
     
-    return False
+    return True
+
+def process_split_object(obj_file_path, output_path):
+    """Parse, analyze and fix one split object; runs in a worker process"""
+    from obj_model_processor import OBJParser
+    
+    # Parse once and share it between the analyze and fix stages
+    parser = OBJParser()
+    parser.parse_file(obj_file_path)
+    
+    analysis = analyze_object_bounds(obj_file_path, parser=parser)
+    fixed = fix_obj_for_printing(obj_file_path, output_path, parser=parser)
+    return analysis, fixed
 
 def analyze_and_fix_split_objects(split_dir):
     """Analyze and fix both split objects for 3D printing"""
@@ -198,12 +338,19 @@ def analyze_and_fix_split_objects(split_dir):
         print("Split objects not found. Run object_grouper.py first.")
         return
     
-    print("Analyzing split objects...")
+    print("Analyzing and fixing split objects for 3D printing...")
     print("=" * 50)
     
-    # Analyze original objects
-    obj1_analysis = analyze_object_bounds(object1_path)
-    obj2_analysis = analyze_object_bounds(object2_path)
+    # The two objects share nothing, so process them in parallel
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        future1 = executor.submit(process_split_object, object1_path,
+                                  os.path.join(split_dir, "Object1_printable.obj"))
+        future2 = executor.submit(process_split_object, object2_path,
+                                  os.path.join(split_dir, "Object2_printable.obj"))
+        obj1_analysis, obj1_fixed = future1.result()
+        obj2_analysis, obj2_fixed = future2.result()
+    
+    print("\n" + "=" * 50)
     
     if obj1_analysis and obj2_analysis:
         print("Object1 bounds:")
@@ -231,13 +378,6 @@ def analyze_and_fix_split_objects(split_dir):
         else:
             print("  Object2 is positioned above Object1")
     
-    print("\n" + "=" * 50)
-    print("Fixing objects for 3D printing...")
-    
-    # Fix both objects
-    obj1_fixed = fix_obj_for_printing(object1_path, os.path.join(split_dir, "Object1_printable.obj"))
-    obj2_fixed = fix_obj_for_printing(object2_path, os.path.join(split_dir, "Object2_printable.obj"))
-    
     if obj1_fixed and obj2_fixed:
         print("\n" + "=" * 50)
         print("Objects fixed successfully!")
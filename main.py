@@ -1,9 +1,17 @@
 import sys
 import os
+import gc
 import re
 import time
 import json
+import hashlib
+import random
+import itertools
+import ctypes
+from array import array
+from operator import itemgetter
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QTextEdit, 
@@ -11,17 +19,385 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QGroupBox, QSplitter, QMessageBox, QProgressBar,
                              QCheckBox, QSlider, QProgressDialog, QDialog)
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QThread, QObject, QEventLoop, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont
 from OpenGL.GL import *
-from OpenGL.GLU import *
 from model_cache import get_cache
 from md3_styles import get_md3_stylesheet, get_md3_colors
 
 
+# OpenGL component types for the numpy dtypes used in GPU buffers
+GL_ARRAY_TYPES = {
+    np.dtype(np.float32): GL_FLOAT,
+    np.dtype(np.int16): GL_SHORT,
+    np.dtype(np.uint16): GL_UNSIGNED_SHORT,
+    np.dtype(np.uint32): GL_UNSIGNED_INT,
+}
+
+
+def upload_static_buffer(target, data):
+    """Fill the buffer bound to target with data that is never modified afterwards
+    
+    GL 4.4 contexts get immutable storage (glBufferStorage), which lets the driver place the
+    data for drawing without keeping it reallocatable, older ones fall back to glBufferData.
+    """
+    if data.nbytes and bool(glBufferStorage):
+        glBufferStorage(target, data.nbytes, data, 0)
+    else:
+        glBufferData(target, data.nbytes, data, GL_STATIC_DRAW)
+
+
+def pack_normals(normal_data):
+    """Quantize unit normals to int16, glNormalPointer maps GL_SHORT back to [-1, 1]"""
+    if normal_data.dtype == np.int16:
+        return normal_data
+    return np.round(normal_data * 32767).astype(np.int16)
+
+
+def interleave_vertex_data(vertex_data, normal_data):
+    """Pack flat positions and normals into one byte array with a (position, normal) record per vertex
+    
+    Returns (interleaved, stride, normal_offset) for glVertexPointer/glNormalPointer, the
+    stride is rounded up to 4 bytes.
+    """
+    position_bytes = 3 * vertex_data.itemsize
+    normal_offset = position_bytes
+    stride = -(-(normal_offset + 3 * normal_data.itemsize) // 4) * 4
+    layout = np.dtype({'names': ['position', 'normal'],
+                       'formats': [(vertex_data.dtype, 3), (normal_data.dtype, 3)],
+                       'offsets': [0, normal_offset], 'itemsize': stride})
+    records = np.zeros(len(vertex_data) // 3, dtype=layout)
+    records['position'] = vertex_data.reshape(-1, 3)
+    records['normal'] = normal_data.reshape(-1, 3)
+    return records.view(np.uint8), stride, normal_offset
+
+
+def quantize_positions(vertices, step):
+    """Store positions as int16 multiples of step, draw code scales them back by step"""
+    # Round and clip in place on the one float32 temporary before the int16 cast
+    steps = np.divide(vertices, step, dtype=np.float32)
+    np.round(steps, out=steps)
+    np.clip(steps, -32767, 32767, out=steps)
+    return steps.astype(np.int16)
+
+
+def weld_vertices(vertices, faces, step):
+    """Merge vertices that quantize to the same int16 position and remap faces onto the survivors
+    
+    Survivors keep the order of their first occurrence, vertices and faces are returned
+    unchanged when nothing coincides.
+    """
+    # Pack the three 16-bit grid coordinates of each vertex into one integer key
+    grid = quantize_positions(vertices, step).astype(np.int64) + 32768
+    keys = (grid[:, 0] << 32) | (grid[:, 1] << 16) | grid[:, 2]
+    unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    if len(unique_keys) == len(vertices):
+        return vertices, faces
+    
+    # Renumber the unique positions by first occurrence instead of key order
+    order = np.argsort(first)
+    rank = np.empty(len(order), dtype=faces.dtype)
+    rank[order] = np.arange(len(order), dtype=faces.dtype)
+    return vertices[first[order]], rank[inverse.ravel()][faces]
+
+
+def accumulate_vertex_normals(vertices, triangles, normals):
+    """Add each triangle's unit normal to its three vertices and normalize (compiled with numba)"""
+    for t in range(triangles.shape[0]):
+        i0, i1, i2 = triangles[t, 0], triangles[t, 1], triangles[t, 2]
+        e1x = vertices[i1, 0] - vertices[i0, 0]
+        e1y = vertices[i1, 1] - vertices[i0, 1]
+        e1z = vertices[i1, 2] - vertices[i0, 2]
+        e2x = vertices[i2, 0] - vertices[i0, 0]
+        e2y = vertices[i2, 1] - vertices[i0, 1]
+        e2z = vertices[i2, 2] - vertices[i0, 2]
+        nx = e1y * e2z - e1z * e2y
+        ny = e1z * e2x - e1x * e2z
+        nz = e1x * e2y - e1y * e2x
+        
+        # Skip degenerate triangles (e.g. two corners welded into one index), their rounding
+        # residual would otherwise be normalized into an arbitrary unit normal
+        length_sq = nx * nx + ny * ny + nz * nz
+        edge_sq = (e1x * e1x + e1y * e1y + e1z * e1z) * (e2x * e2x + e2y * e2y + e2z * e2z)
+        if length_sq > 1e-12 * edge_sq:
+            length = np.sqrt(length_sq)
+            for k in range(3):
+                vertex = triangles[t, k]
+                normals[vertex, 0] += nx / length
+                normals[vertex, 1] += ny / length
+                normals[vertex, 2] += nz / length
+    
+    for i in range(normals.shape[0]):
+        length = np.sqrt(normals[i, 0] ** 2 + normals[i, 1] ** 2 + normals[i, 2] ** 2)
+        if length > 0:
+            normals[i, 0] /= length
+            normals[i, 1] /= length
+            normals[i, 2] /= length
+        else:
+            normals[i, 2] = 1.0  # Default normal
+
+
+def normalize_rows(vectors, default=None):
+    """Normalize (N, 3) vectors in place, zero-length rows are set to default (or left at zero)"""
+    lengths = np.sqrt(np.einsum('ij,ij->i', vectors, vectors))[:, None]
+    nonzero = lengths > 0
+    np.divide(vectors, lengths, out=vectors, where=nonzero)
+    if default is not None:
+        vectors[~nonzero[:, 0]] = default
+    return vectors
+
+
+def fan_triangulate(faces):
+    """Fan-triangulate a list of index faces into a (T, 3) int64 array without a per-triangle loop"""
+    if isinstance(faces, np.ndarray) and faces.ndim == 2 and faces.shape[1] == 3:
+        return faces.astype(np.int64, copy=False)
+    
+    face_lengths = np.fromiter((len(face) for face in faces), dtype=np.int64, count=len(faces))
+    flat_indices = np.fromiter(itertools.chain.from_iterable(faces), dtype=np.int64, count=int(face_lengths.sum()))
+    return fan_triangulate_flat(face_lengths, flat_indices)
+
+
+def fan_triangulate_flat(face_lengths, flat_indices):
+    """Fan-triangulate faces given as corner counts and their concatenated corner indices"""
+    face_lengths = np.asarray(face_lengths, dtype=np.int64)
+    
+    # All faces with the same corner count (all triangles, all quads): broadcast the first
+    # corner against the shifted remaining ones, no per-triangle index arithmetic needed
+    if len(face_lengths) and (face_lengths == face_lengths[0]).all():
+        corner_count = int(face_lengths[0])
+        if corner_count < 3:
+            return np.empty((0, 3), dtype=np.int64)
+        corners = np.asarray(flat_indices, dtype=np.int64).reshape(-1, corner_count)
+        triangles = np.empty((len(corners), corner_count - 2, 3), dtype=np.int64)
+        triangles[:, :, 0] = corners[:, :1]
+        triangles[:, :, 1] = corners[:, 1:-1]
+        triangles[:, :, 2] = corners[:, 2:]
+        return triangles.reshape(-1, 3)
+    
+    face_starts = np.cumsum(face_lengths) - face_lengths
+    
+    # Face with k corners gives k - 2 triangles (first, j + 1, j + 2)
+    triangle_counts = np.maximum(face_lengths - 2, 0)
+    first_triangle = np.cumsum(triangle_counts) - triangle_counts
+    
+    # Corner j of triangle t sits at t + (face start - face's first triangle), so one
+    # repeated shift plus a running index walks the second and third corners in place
+    corner = np.repeat(face_starts - first_triangle, triangle_counts)
+    corner += np.arange(len(corner))
+    
+    triangles = np.empty((len(corner), 3), dtype=np.int64)
+    triangles[:, 0] = flat_indices[np.repeat(face_starts, triangle_counts)]
+    corner += 1
+    triangles[:, 1] = flat_indices[corner]
+    corner += 1
+    triangles[:, 2] = flat_indices[corner]
+    return triangles
+
+
+def unique_edges(triangle_indices, vertex_count):
+    """Distinct undirected edges of flat triangle indices as an (E, 2) array sorted by first vertex"""
+    triangles = np.asarray(triangle_indices, dtype=np.int64).reshape(-1, 3)
+    first = triangles.ravel()
+    second = triangles[:, [1, 2, 0]].ravel()
+    
+    # Encode each edge as one integer (low vertex * count + high vertex), so a 1-D unique dedupes it
+    keys = np.unique(np.minimum(first, second) * vertex_count + np.maximum(first, second))
+    return np.column_stack(np.divmod(keys, vertex_count))
+
+
+def format_rows(line_format, rows):
+    """Format every row of a 2-D array with one %-format pass, e.g. 'v %.6f %.6f %.6f\\n'"""
+    return (line_format * len(rows)) % tuple(rows.ravel().tolist())
+
+
+def compact_indices(indices):
+    """Sorted distinct values of an index array and the array remapped to positions among them
+    
+    Marks a boolean table over the index range instead of sorting, objects usually use a compact range of vertices
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    if indices.size == 0:
+        return np.empty(0, dtype=np.int64), np.zeros(indices.shape, dtype=np.int64)
+    
+    low = int(indices.min())
+    offsets = indices - low
+    used_mask = np.zeros(int(offsets.max()) + 1, dtype=bool)
+    used_mask[offsets] = True
+    positions = np.cumsum(used_mask) - 1  # Position of each marked value among the used ones
+    return np.flatnonzero(used_mask) + low, positions[offsets]
+
+
+def parse_face_reference(text):
+    """0-based index of one v/vt/vn field of a face token, -1 without digits, read like parse_face_corners does"""
+    try:
+        return int(text) - 1
+    except ValueError:
+        # Malformed field (comment glued to the line, stray characters): keep its digits and sign
+        digits = ''.join(c for c in text if '0' <= c <= '9')
+        if not digits:
+            return -1
+        return (-int(digits) if '-' in text else int(digits)) - 1
+
+
+def parse_face_corners(data, face_sizes, v_refs, vt_refs, vn_refs):
+    """Parse newline separated 'f ...' lines into corner counts and 0-based v/vt/vn indices, -1 where missing (compiled with numba)"""
+    length = data.shape[0]
+    pos = 0
+    face = 0
+    corner = 0
+    while pos < length:
+        # Skip to the next 'f' command, lines may be separated by blank lines
+        if data[pos] != 102:
+            pos += 1
+            continue
+        pos += 1
+        size = 0
+        while pos < length and data[pos] != 10:
+            # Space, tab, vertical tab, form feed and CR separate corners (other str.split()
+            # whitespace is sent to the Python parser by parse_face_lines)
+            if data[pos] == 32 or 9 <= data[pos] <= 13:
+                pos += 1
+                continue
+            
+            # One corner token, up to three '/' separated integers
+            v_refs[corner] = -1
+            vt_refs[corner] = -1
+            vn_refs[corner] = -1
+            field = 0
+            value = 0
+            sign = 1
+            has_digits = False
+            while True:
+                c = int(data[pos]) if pos < length else 10
+                if c == 47 or c == 32 or 9 <= c <= 13:
+                    # End of a field ('/') or of the token
+                    if has_digits:
+                        if field == 0:
+                            v_refs[corner] = sign * value - 1
+                        elif field == 1:
+                            vt_refs[corner] = sign * value - 1
+                        elif field == 2:
+                            vn_refs[corner] = sign * value - 1
+                    if c != 47:
+                        break
+                    field += 1
+                    value = 0
+                    sign = 1
+                    has_digits = False
+                elif c == 45:  # '-'
+                    sign = -1
+                elif 48 <= c <= 57:
+                    value = value * 10 + (c - 48)
+                    has_digits = True
+                pos += 1
+            
+            corner += 1
+            size += 1
+        face_sizes[face] = size
+        face += 1
+        pos += 1  # Newline
+    return corner
+
+
+def format_face_bytes(face_sizes, v_new, vt_new, vn_new, has_texcoords, has_normals, out):
+    """Write printable 'f ...' lines as ASCII into out from 1-based corner references, 0 where missing (compiled with numba)
+    
+    Same output as OBJParser.format_face_lines, returns the number of bytes written.
+    """
+    full_format = has_texcoords and has_normals
+    pos = 0
+    start = 0
+    for face in range(face_sizes.shape[0]):
+        end = start + face_sizes[face]
+        
+        # Corners without a vertex are dropped, faces left with fewer than 3 corners are not written
+        kept = 0
+        for i in range(start, end):
+            if v_new[i] > 0:
+                kept += 1
+        if kept < 3:
+            start = end
+            continue
+        
+        out[pos] = 102  # 'f'
+        pos += 1
+        for i in range(start, end):
+            if v_new[i] <= 0:
+                continue
+            out[pos] = 32
+            pos += 1
+            
+            # Slashes written before the vt and vn fields for this corner's format
+            vt = vt_new[i] if has_texcoords else 0
+            vn = vn_new[i] if has_normals else 0
+            if full_format:
+                vt_slashes, vn_slashes = 1, 1
+            elif vt > 0:
+                vt_slashes, vn_slashes = 1, 0
+                vn = 0
+            elif vn > 0:
+                vt_slashes, vn_slashes = 0, 2
+            else:
+                vt_slashes, vn_slashes = 0, 0
+            
+            for field in range(3):
+                if field == 0:
+                    value = v_new[i]
+                elif field == 1:
+                    value = vt
+                    for _ in range(vt_slashes):
+                        out[pos] = 47
+                        pos += 1
+                else:
+                    value = vn
+                    for _ in range(vn_slashes):
+                        out[pos] = 47
+                        pos += 1
+                if value > 0:
+                    digits = 1
+                    scale = 10
+                    while scale <= value:
+                        digits += 1
+                        scale *= 10
+                    for digit in range(digits - 1, -1, -1):
+                        out[pos + digit] = 48 + value % 10
+                        value //= 10
+                    pos += digits
+        out[pos] = 10
+        pos += 1
+        start = end
+    return pos
+
+
+NUMBA_KERNELS = {}  # {function: compiled function, or False when numba is not installed}
+
+
+def get_numba_kernel(function):
+    """Compile one of the kernel functions above with numba on first use"""
+    kernel = NUMBA_KERNELS.get(function)
+    if kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            kernel = False
+        else:
+            # No fastmath: contracting the cross products into FMAs leaves residuals
+            # where exact zeros are expected (degenerate triangles in the normals kernel)
+            kernel = njit(cache=True, nogil=True)(function)
+        NUMBA_KERNELS[function] = kernel
+    return kernel
+
+
 class MeshSimplifier:
     """Simple mesh simplification for LOD rendering"""
     
+    # Set by --legacy-decimate to always use stride decimation instead of meshoptimizer
+    use_legacy_decimation = False
+    
+    # Objects below min_simplify_faces get no LODs, levels below min_lod_faces are not kept
+    min_simplify_faces = 256
+    min_lod_faces = 64
+    
     @staticmethod
     def simplify_mesh(vertices, faces, reduction_factor=0.5):
         """
@@ -31,6 +407,11 @@ class MeshSimplifier:
         if reduction_factor >= 1.0:
             return vertices, faces
         
+        if not MeshSimplifier.use_legacy_decimation:
+            simplified = MeshSimplifier.simplify_quadric(vertices, faces, reduction_factor)
+            if simplified is not None:
+                return simplified
+        
         original_count = len(faces)
         
         # Calculate target number of faces
@@ -48,45 +429,160 @@ class MeshSimplifier:
         
         print(f"    Simplification: {original_count} → {len(simplified_faces)} faces (target: {target_faces}, step: {step})")
         
-        # Get unique vertices used by simplified faces
-        used_vertices = set()
-        for face in simplified_faces:
-            for idx in face:
-                used_vertices.add(idx)
-        
-        # Create vertex mapping
-        vertex_list = sorted(used_vertices)
-        vertex_map = {old_idx: new_idx for new_idx, old_idx in enumerate(vertex_list)}
-        
-        # Remap faces
-        remapped_faces = []
-        for face in simplified_faces:
-            remapped_face = [vertex_map[idx] for idx in face]
-            remapped_faces.append(remapped_face)
+        return MeshSimplifier.compact_mesh(vertices, simplified_faces)
+    
+    @staticmethod
+    def simplify_quadric(vertices, faces, reduction_factor):
+        """
+        Simplify mesh with meshoptimizer's quadric edge collapse
+        Returns None when meshoptimizer is not installed so the caller can fall back to decimation
+        """
+        try:
+            from meshoptimizer import simplify, simplify_sloppy, optimize_vertex_cache
+        except ImportError:
+            return None
+        
+        # meshoptimizer works on triangle lists, so fan-triangulate first
+        triangles = fan_triangulate(faces)
+        if len(triangles) == 0:
+            return None
+        
+        vertex_array = np.ascontiguousarray(vertices, dtype=np.float32)
+        indices = triangles.astype(np.uint32).ravel()
+        target_index_count = max(int(len(indices) * reduction_factor) // 3, 1) * 3
+        
+        destination = np.zeros_like(indices)
+        index_count = simplify(destination, indices, vertex_array,
+                               index_count=len(indices), vertex_count=len(vertex_array),
+                               vertex_positions_stride=vertex_array.strides[0],
+                               target_index_count=target_index_count, target_error=0.01)
+        
+        # Topology-preserving collapse can stall far above the target on very aggressive
+        # reductions, sloppy simplification ignores topology and always gets there
+        if index_count > target_index_count * 2:
+            index_count = simplify_sloppy(destination, indices, vertex_array,
+                                          index_count=len(indices), vertex_count=len(vertex_array),
+                                          vertex_positions_stride=vertex_array.strides[0],
+                                          target_index_count=target_index_count, target_error=0.01)
+        
+        # Collapses leave triangles in source order, reorder them for the post-transform vertex cache
+        simplified_indices = np.zeros(index_count, dtype=np.uint32)
+        optimize_vertex_cache(simplified_indices, destination[:index_count],
+                              index_count=index_count, vertex_count=len(vertex_array))
+        
+        simplified_faces = simplified_indices.reshape(-1, 3)
+        print(f"    Simplification: {len(faces)} → {len(simplified_faces)} triangles (target: {target_index_count // 3}, quadric)")
+        
+        return MeshSimplifier.compact_mesh(vertex_array, simplified_faces)
+    
+    @staticmethod
+    def compact_mesh(vertices, faces):
+        """Drop vertices not referenced by faces and remap the face indices"""
+        # Triangle arrays can be remapped without flattening face by face
+        if isinstance(faces, np.ndarray) and faces.ndim == 2:
+            vertex_list, remapped_faces = compact_indices(faces)
+            return np.asarray(vertices, dtype=np.float32)[vertex_list], remapped_faces
+        
+        # Get unique vertices used by faces and remap faces in one pass
+        face_lengths = np.fromiter((len(face) for face in faces), dtype=np.int64, count=len(faces))
+        flat_indices = np.fromiter(itertools.chain.from_iterable(faces), dtype=np.int64, count=int(face_lengths.sum()))
+        vertex_list, remapped_flat = compact_indices(flat_indices)
+        
+        # Remap faces (uniform faces become a single (F, k) array)
+        if len(face_lengths) and (face_lengths == face_lengths[0]).all():
+            remapped_faces = remapped_flat.reshape(len(face_lengths), int(face_lengths[0]))
+        else:
+            remapped_faces = np.split(remapped_flat, np.cumsum(face_lengths)[:-1])
         
         # Get simplified vertices
-        simplified_vertices = [vertices[idx] for idx in vertex_list]
+        simplified_vertices = np.asarray(vertices, dtype=np.float32)[vertex_list]
         
         return simplified_vertices, remapped_faces
     
     @staticmethod
     def create_lod_levels(vertices, faces, levels=4):
-        """Create multiple LOD levels"""
-        lod_levels = []
+        """Create multiple LOD levels, stopping once further levels would not save anything visible"""
+        lod_levels = [(vertices, faces)]
         reductions = [1.0, 0.5, 0.25, 0.1]  # 100%, 50%, 25%, 10%
         
-        for i in range(min(levels, len(reductions))):
-            if i == 0:
-                lod_levels.append((vertices, faces))
-            else:
-                simplified_verts, simplified_faces = MeshSimplifier.simplify_mesh(
-                    vertices, faces, reductions[i]
-                )
-                lod_levels.append((simplified_verts, simplified_faces))
+        # Small objects look the same at every level, keep the original mesh only
+        if len(faces) < MeshSimplifier.min_simplify_faces:
+            return lod_levels
+        
+        for i in range(1, min(levels, len(reductions))):
+            previous_verts, previous_faces = lod_levels[-1]
+            simplified_verts, simplified_faces = MeshSimplifier.simplify_mesh(
+                vertices, faces, reductions[i]
+            )
+            
+            # Stop when the level gets too coarse or drops less than a quarter of the previous level's vertices
+            if len(simplified_faces) < MeshSimplifier.min_lod_faces or len(simplified_verts) * 4 > len(previous_verts) * 3:
+                break
+            lod_levels.append((simplified_verts, simplified_faces))
         
         return lod_levels
 
 
+class MeshBuildWorker(QObject):
+    """Builds per-object GPU buffer data for load_all_objects off the GUI thread"""
+    
+    progress = pyqtSignal(int)
+    object_ready = pyqtSignal(str, object, object, object, object)  # name, local_verts, faces, vbo_data_list, transform
+    finished = pyqtSignal()
+    
+    def __init__(self, object_vertices, object_centers, object_bounds, global_center, global_scale):
+        super().__init__()
+        self.object_vertices = object_vertices
+        self.object_centers = object_centers
+        self.object_bounds = object_bounds
+        self.global_center = global_center
+        self.global_scale = global_scale
+        self.cancelled = False
+        self.geometry_cache = {}  # {geometry digest: vbo_data_list} shared by identical objects
+    
+    def build_object(self, item):
+        """Center one object on its centroid and build its buffers"""
+        obj_name, (vertices, faces) = item
+        
+        # Center on the object's own centroid, global and single view placement is applied when drawing
+        center = self.object_centers[obj_name]
+        low, high = self.object_bounds[obj_name]
+        local_verts = vertices - center.astype(np.float32)
+        local_max = max(np.max(np.abs(low - center)), np.max(np.abs(high - center)))
+        single_scale = 2.0 / local_max if local_max > 0 else 1.0
+        
+        # Buffers hold int16 positions in steps of local_max / 32767, the transform scales them back
+        step = local_max / 32767 if local_max > 0 else None
+        unit = step or 1.0
+        transform = (tuple(((center - self.global_center) / unit).tolist()), self.global_scale * unit, single_scale * unit)
+        
+        # Identical objects (instanced parts, repeated CAD components) reuse one set of buffers
+        digest = hashlib.blake2b(local_verts.tobytes(), digest_size=16)
+        digest.update(np.ascontiguousarray(faces).tobytes())
+        key = digest.digest()
+        vbo_data_list = self.geometry_cache.get(key)
+        if vbo_data_list is None:
+            # Skip LOD generation - create single GPU buffer for original mesh
+            vbo_data_list = [OBJViewer.create_gpu_buffers(local_verts, faces, position_step=step)]
+            self.geometry_cache[key] = vbo_data_list
+        return obj_name, local_verts, faces, vbo_data_list, transform
+    
+    def process(self):
+        """Build all objects, NumPy releases the GIL so a thread pool spreads them over the cores"""
+        total_objects = len(self.object_vertices)
+        executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        try:
+            results = executor.map(self.build_object, self.object_vertices.items())
+            for i, result in enumerate(results):
+                if self.cancelled:
+                    break
+                self.object_ready.emit(*result)
+                self.progress.emit(20 + int(((i + 1) / total_objects) * 75))  # 20-95% for object processing
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.finished.emit()
+
+
 class OBJViewer(QOpenGLWidget):
     """OpenGL widget for 3D visualization with GPU-accelerated LOD support"""
     
@@ -120,17 +616,32 @@ class OBJViewer(QOpenGLWidget):
         # GPU buffers (VBOs)
         self.vbo_data = []  # List of (vertex_buffer, index_buffer, index_count) for each LOD
         self.use_gpu = True
+        self.gl_buffers = {}  # {id(index_data): (index_data, (vertex_vbo, index_ibo), vao, (stride, normal_offset))}
         
         # Multi-object display
         self.show_all_objects = False
         self.all_objects_data = {}  # {object_name: [(vbo_data), color, is_selected]}
-        self.selected_objects = set()  # Set of selected object names
+        self.selected_objects = set()  # Set of selected object names, change it through set_object_selected/set_selection
+        self.object_ids = {}  # {object_name: slot in selected_mask}, assigned on first use
+        self.selected_mask = np.zeros(0, dtype=bool)  # selected_objects by object id, read by the scene batches
+        self.scene_batches = {}  # {lod: batch dict} with all objects merged into shared GL buffers
+        self.selection_version = 0  # Bumped on selection changes so batches know to re-upload colors
+        self.retired_buffers = []  # GL buffer ids to delete on the next paint
+        
+        # Object buffers are stored centered on each object's own centroid and shared by
+        # both views, these place them: {object_name: (global_offset, global_scale, single_scale)}
+        self.object_transforms = {}
+        self.model_scale = 1.0  # Scale applied to vbo_data in single object mode
+        self.model_id = None  # OBJParser model id of the mesh shown in single object mode
+        self.model_buffers = {}  # {model id: (vertices, faces, vbo_data)} built by set_model, cleared on file load
+        self.load_progress_dialog = None  # Progress dialog of the running load_all_objects
         
     def initializeGL(self):
         glEnable(GL_DEPTH_TEST)
         glEnable(GL_LIGHTING)
         glEnable(GL_LIGHT0)
         glEnable(GL_COLOR_MATERIAL)
+        glEnable(GL_RESCALE_NORMAL)  # Object buffers are drawn with a uniform glScalef
         glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
         
         glLightfv(GL_LIGHT0, GL_POSITION, [1, 1, 1, 0])
@@ -144,6 +655,9 @@ class OBJViewer(QOpenGLWidget):
         glEnableClientState(GL_NORMAL_ARRAY)
         
     def resizeGL(self, w, h):
+        # GLU is only needed for the projection setup, so load it on first resize
+        from OpenGL.GLU import gluPerspective
+        
         glViewport(0, 0, w, h)
         glMatrixMode(GL_PROJECTION)
         glLoadIdentity()
@@ -154,6 +668,11 @@ class OBJViewer(QOpenGLWidget):
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glLoadIdentity()
         
+        # Free buffers of batches dropped outside the GL context
+        if self.retired_buffers:
+            glDeleteBuffers(len(self.retired_buffers), self.retired_buffers)
+            self.retired_buffers = []
+        
         # Apply camera transformations: pan, then zoom, then rotation
         glTranslatef(self.pan_x, self.pan_y, self.zoom)
         glRotatef(self.rotation_x, 1, 0, 0)
@@ -163,8 +682,14 @@ class OBJViewer(QOpenGLWidget):
         if self.show_all_objects:
             if self.all_objects_data:
                 self.draw_model()
-        elif self.vertices and self.faces:
+        elif len(self.vertices) > 0 and len(self.faces) > 0:
             self.draw_model()
+        
+        # Unbind buffers so Qt's own painting isn't affected
+        if bool(glBindVertexArray):
+            glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
             
     def draw_model(self):
         """GPU-accelerated rendering using VBOs"""
@@ -198,16 +723,90 @@ class OBJViewer(QOpenGLWidget):
             color = lod_colors[min(self.current_lod, len(lod_colors) - 1)]
             glColor3fv(color)
             
+            glPushMatrix()
+            glScalef(self.model_scale, self.model_scale, self.model_scale)
             self.draw_vbo(vertex_data, normal_data, index_data, index_count)
+            glPopMatrix()
+    
+    def bind_gpu_buffers(self, vertex_data, normal_data, index_data):
+        """Bind the GL buffers for a mesh, uploading it on first use"""
+        # Mesh arrays stay on the CPU side (they are pickled into the model cache),
+        # the GL buffers are created lazily here while the context is current
+        entry = self.gl_buffers.get(id(index_data))
+        if entry is None:
+            # A vertex array object records the pointer setup below, later draws only bind it
+            # (needs GL 3.0, older contexts repeat the setup on every draw)
+            vao = glGenVertexArrays(1) if bool(glGenVertexArrays) else 0
+            if vao:
+                glBindVertexArray(vao)
+                glEnableClientState(GL_VERTEX_ARRAY)
+                glEnableClientState(GL_NORMAL_ARRAY)
+            # Positions and normals share one interleaved buffer, each vertex is fetched from one record
+            interleaved, stride, normal_offset = interleave_vertex_data(vertex_data, normal_data)
+            vertex_vbo, index_ibo = glGenBuffers(2)
+            glBindBuffer(GL_ARRAY_BUFFER, vertex_vbo)
+            upload_static_buffer(GL_ARRAY_BUFFER, interleaved)
+            glVertexPointer(3, GL_ARRAY_TYPES[vertex_data.dtype], stride, None)
+            glNormalPointer(GL_ARRAY_TYPES[normal_data.dtype], stride, ctypes.c_void_p(normal_offset))
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, index_ibo)
+            upload_static_buffer(GL_ELEMENT_ARRAY_BUFFER, index_data)
+            # Keep a reference to index_data so its id stays unique while the entry exists
+            entry = (index_data, (vertex_vbo, index_ibo), vao, (stride, normal_offset))
+            self.gl_buffers[id(index_data)] = entry
+            return
+        
+        _, (vertex_vbo, index_ibo), vao, (stride, normal_offset) = entry
+        if vao:
+            glBindVertexArray(vao)
+            return
+        glBindBuffer(GL_ARRAY_BUFFER, vertex_vbo)
+        glVertexPointer(3, GL_ARRAY_TYPES[vertex_data.dtype], stride, None)
+        glNormalPointer(GL_ARRAY_TYPES[normal_data.dtype], stride, ctypes.c_void_p(normal_offset))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, index_ibo)
+    
+    def delete_gl_objects(self, buffer_ids, vertex_arrays):
+        """Delete GL buffers and vertex array objects, making the context current"""
+        if not buffer_ids and not vertex_arrays:
+            return
+        self.makeCurrent()
+        if buffer_ids:
+            glDeleteBuffers(len(buffer_ids), buffer_ids)
+        if vertex_arrays:
+            glDeleteVertexArrays(len(vertex_arrays), vertex_arrays)
+        self.doneCurrent()
+    
+    def release_gpu_buffers(self):
+        """Delete all GL buffers uploaded so far"""
+        buffer_ids = [buffer_id for entry in self.gl_buffers.values() for buffer_id in entry[1]]
+        vertex_arrays = [entry[2] for entry in self.gl_buffers.values() if entry[2]]
+        buffer_ids.extend(buffer_id for batch in self.scene_batches.values()
+                          if batch is not None for buffer_id in batch['buffers'])
+        buffer_ids.extend(self.retired_buffers)
+        self.gl_buffers = {}
+        self.scene_batches = {}
+        self.retired_buffers = []
+        self.delete_gl_objects(buffer_ids, vertex_arrays)
+    
+    def release_mesh_buffers(self, vbo_data):
+        """Delete the GL buffers of one mesh's LODs, other uploads stay resident"""
+        buffer_ids = []
+        vertex_arrays = []
+        for _, _, index_data, _ in vbo_data:
+            entry = self.gl_buffers.pop(id(index_data), None)
+            if entry is not None:
+                buffer_ids.extend(entry[1])
+                if entry[2]:
+                    vertex_arrays.append(entry[2])
+        self.delete_gl_objects(buffer_ids, vertex_arrays)
     
     def draw_vbo(self, vertex_data, normal_data, index_data, index_count, is_selected=False):
         """Draw VBO data with optional selection highlighting"""
-        # Set vertex and normal pointers
-        glVertexPointer(3, GL_FLOAT, 0, vertex_data)
-        glNormalPointer(GL_FLOAT, 0, normal_data)
+        # Bind vertex, normal and index buffers
+        self.bind_gpu_buffers(vertex_data, normal_data, index_data)
         
         # Draw the main object
-        glDrawElements(GL_TRIANGLES, index_count, GL_UNSIGNED_INT, index_data)
+        index_type = GL_ARRAY_TYPES[index_data.dtype]
+        glDrawElements(GL_TRIANGLES, index_count, index_type, None)
         
         # Draw selection highlight if needed
         if is_selected:
@@ -215,7 +814,7 @@ class OBJViewer(QOpenGLWidget):
             glColor3f(1.0, 0.5, 0.0)  # Orange highlight
             glLineWidth(3.0)
             glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-            glDrawElements(GL_TRIANGLES, index_count, GL_UNSIGNED_INT, index_data)
+            glDrawElements(GL_TRIANGLES, index_count, index_type, None)
             glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             glEnable(GL_LIGHTING)
     
@@ -223,27 +822,40 @@ class OBJViewer(QOpenGLWidget):
         """Draw multiple selected objects in their original positions"""
         if not self.all_objects_data or not self.selected_objects:
             return
-            
-        for obj_name, (vbo_data_list, color, is_selected) in self.all_objects_data.items():
-            if obj_name not in self.selected_objects:
-                continue
-                
-            if not vbo_data_list or self.current_lod >= len(vbo_data_list):
-                continue
-            
-            vertex_data, normal_data, index_data, index_count = vbo_data_list[self.current_lod]
-            
-            if index_count == 0:
-                continue
-            
-            glPushMatrix()
-            
-            # Use original object colors in single mode (no selection highlighting)
-            glColor3fv(color)
-            
-            self.draw_vbo(vertex_data, normal_data, index_data, index_count, False)
-            
-            glPopMatrix()
+        
+        # The merged scene batch already holds every object at its position in the full model,
+        # so the selected objects are its selected ranges, submitted in one call
+        batch = self.get_scene_batch(self.current_lod)
+        if batch is None:
+            return
+        if batch['selection_version'] != self.selection_version:
+            self.update_scene_colors(batch)
+        if len(batch['selected_indices']) == 0:
+            return
+        
+        # Use original object colors in single mode (no selection highlighting)
+        if 'base_color_vbo' not in batch:
+            colors = np.repeat(batch['base_colors'], batch['vertex_counts'], axis=0)
+            batch['base_color_vbo'] = glGenBuffers(1)
+            batch['buffers'] += (batch['base_color_vbo'],)
+            glBindBuffer(GL_ARRAY_BUFFER, batch['base_color_vbo'])
+            upload_static_buffer(GL_ARRAY_BUFFER, colors)
+        
+        # Selected objects outside the view are left out of the draw ranges
+        visible = self.get_visible_objects(batch)
+        selected_indices = batch['selected_indices']
+        if visible[selected_indices].all():
+            ranges = batch['selected_ranges']
+        else:
+            selected_indices = selected_indices[visible[selected_indices]]
+            if len(selected_indices) == 0:
+                return
+            ranges = self.get_draw_ranges(batch['counts'], batch['byte_offsets'], batch['base_vertices'], selected_indices)
+        
+        self.bind_scene_batch(batch, batch['base_color_vbo'])
+        glEnableClientState(GL_COLOR_ARRAY)
+        self.multi_draw(GL_TRIANGLES, batch['index_type'], ranges)
+        glDisableClientState(GL_COLOR_ARRAY)
     
     def draw_all_objects(self):
         """Draw all objects with selection highlighting"""
@@ -251,59 +863,291 @@ class OBJViewer(QOpenGLWidget):
             return
         
         # Use current LOD level (respects user's LOD slider)
-        lod = self.current_lod
-        
-        for obj_name, obj_data in self.all_objects_data.items():
-            vbo_data_list, base_color, _ = obj_data
-            
+        batch = self.get_scene_batch(self.current_lod)
+        if batch is None:
+            return
+        if batch['selection_version'] != self.selection_version:
+            self.update_scene_colors(batch)
+        
+        # Objects outside the view are left out of the draw ranges
+        visible = self.get_visible_objects(batch)
+        all_visible = visible.all()
+        if all_visible:
+            ranges = batch['ranges']
+        else:
+            ranges = self.get_draw_ranges(batch['counts'], batch['byte_offsets'], batch['base_vertices'],
+                                          np.flatnonzero(visible))
+        
+        # Draw all objects in one call - per-vertex colors are dimmed for unselected, bright for selected
+        self.bind_scene_batch(batch, batch['color_vbo'])
+        glEnableClientState(GL_COLOR_ARRAY)
+        self.multi_draw(GL_TRIANGLES, batch['index_type'], ranges)
+        glDisableClientState(GL_COLOR_ARRAY)
+        
+        # Draw thick border for selected objects, each shared edge once from the edge index buffer
+        selected_indices = batch['selected_indices']
+        if not all_visible:
+            selected_indices = selected_indices[visible[selected_indices]]
+        if len(selected_indices) > 0:
+            if 'edge_ibo' not in batch:
+                self.build_scene_edges(batch)
+            outline_ranges = batch['outline_ranges'] if all_visible else None
+            if outline_ranges is None:
+                outline_ranges = self.get_draw_ranges(batch['edge_counts'], batch['edge_offsets'],
+                                                      batch['base_vertices'], selected_indices)
+                if all_visible:
+                    batch['outline_ranges'] = outline_ranges
+            glDisable(GL_LIGHTING)
+            glColor3f(1.0, 0.5, 0.0)  # Orange highlight
+            glLineWidth(4.0)  # Thick border
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, batch['edge_ibo'])
+            self.multi_draw(GL_LINES, batch['index_type'], outline_ranges)
+            glEnable(GL_LIGHTING)
+    
+    @staticmethod
+    def get_visible_objects(batch):
+        """Boolean mask of the batch objects whose bounding boxes intersect the view frustum"""
+        # GL returns column-major matrices, read row-major they are transposed,
+        # so the row-major clip matrix projection @ modelview is (modelview^T @ projection^T)^T
+        modelview = np.asarray(glGetFloatv(GL_MODELVIEW_MATRIX), dtype=np.float64).reshape(4, 4)
+        projection = np.asarray(glGetFloatv(GL_PROJECTION_MATRIX), dtype=np.float64).reshape(4, 4)
+        clip = (modelview @ projection).T
+        
+        # Frustum planes (left, bottom, near, right, top, far) straight from the clip matrix rows;
+        # the far plane also drops objects too distant to see
+        planes = np.concatenate((clip[3] + clip[:3], clip[3] - clip[:3]))
+        normals, distances = planes[:, :3], planes[:, 3]
+        
+        # A box is outside when even its corner furthest along a plane's normal is behind that plane
+        corners = np.where(normals >= 0, batch['bounds_max'][:, None, :], batch['bounds_min'][:, None, :])
+        return (np.einsum('opk,pk->op', corners, normals) + distances >= 0).all(axis=1)
+    
+    @staticmethod
+    def bind_scene_batch(batch, color_vbo):
+        """Bind a scene batch's vertex, color and index buffers"""
+        stride, normal_offset = batch['layout']
+        glBindBuffer(GL_ARRAY_BUFFER, batch['vertex_vbo'])
+        glVertexPointer(3, GL_FLOAT, stride, None)
+        glNormalPointer(GL_SHORT, stride, ctypes.c_void_p(normal_offset))
+        glBindBuffer(GL_ARRAY_BUFFER, color_vbo)
+        glColorPointer(3, GL_FLOAT, 0, None)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, batch['index_ibo'])
+    
+    @staticmethod
+    def get_draw_ranges(counts, byte_offsets, base_vertices, indices=None):
+        """Get (counts, offsets, base_vertices) arguments of multi_draw for the ranges at indices (all by default)"""
+        if indices is not None:
+            counts = counts[indices]
+            byte_offsets = byte_offsets[indices]
+            if base_vertices is not None:
+                base_vertices = base_vertices[indices]
+        offsets = (ctypes.c_void_p * len(counts))(*byte_offsets.tolist())
+        return counts, offsets, base_vertices
+    
+    @staticmethod
+    def multi_draw(mode, index_type, ranges):
+        """Draw several index ranges in one call, offset by per-range base vertices when given"""
+        counts, offsets, base_vertices = ranges
+        if base_vertices is None:
+            glMultiDrawElements(mode, counts, index_type, offsets, len(counts))
+        else:
+            glMultiDrawElementsBaseVertex(mode, counts, index_type, offsets, len(counts), base_vertices)
+    
+    def get_scene_batch(self, lod):
+        """Get all objects of a LOD merged into shared GL buffers, uploading them on first use"""
+        if lod in self.scene_batches:
+            return self.scene_batches[lod]
+        
+        # First pass: pick the objects and size the merged buffers
+        names = []
+        meshes = []
+        vertex_counts = []
+        index_counts = []
+        base_colors = []
+        for obj_name, (vbo_data_list, base_color, _) in self.all_objects_data.items():
             if lod >= len(vbo_data_list):
                 continue
-                
-            vertex_data, normal_data, index_data, index_count = vbo_data_list[lod]
             
-            if index_count == 0:
+            mesh = vbo_data_list[lod]
+            if mesh[3] == 0:
                 continue
             
-            # Determine if object is selected
-            is_selected = obj_name in self.selected_objects
-            
-            # Set color - dimmed for unselected, bright for selected
-            if is_selected:
-                color = (base_color[0] * 1.2, base_color[1] * 1.2, base_color[2] * 1.2)
-            else:
-                color = (base_color[0] * 0.5, base_color[1] * 0.5, base_color[2] * 0.5)
-            
-            glColor3f(*color)
-            
-            # Draw object
-            glVertexPointer(3, GL_FLOAT, 0, vertex_data)
-            glNormalPointer(GL_FLOAT, 0, normal_data)
-            glDrawElements(GL_TRIANGLES, index_count, GL_UNSIGNED_INT, index_data)
-            
-            # Draw thick border for selected objects
-            if is_selected:
-                glDisable(GL_LIGHTING)
-                glColor3f(1.0, 0.5, 0.0)  # Orange highlight
-                glLineWidth(4.0)  # Thick border
-                glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-                glDrawElements(GL_TRIANGLES, index_count, GL_UNSIGNED_INT, index_data)
-                glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
-                glEnable(GL_LIGHTING)
-        
-    def set_model(self, vertices, faces, force_update=False, obj_name=None):
+            names.append(obj_name)
+            meshes.append(mesh)
+            vertex_counts.append(len(mesh[0]) // 3)
+            index_counts.append(mesh[3])
+            base_colors.append(base_color)
+        
+        if not names:
+            self.scene_batches[lod] = None
+            return None
+        
+        # Second pass: write every object straight into its slice of the merged buffers
+        total_vertices = sum(vertex_counts)
+        vertex_data = np.empty((total_vertices, 3), dtype=np.float32)
+        normal_data = np.empty(total_vertices * 3, dtype=np.int16)
+        # Past 65536 merged vertices, objects that each fit 16 bits keep local uint16 indices
+        # and are placed by a per-draw base vertex (GL 3.2) instead of widening to uint32
+        use_base_vertex = total_vertices >= 65536 and max(vertex_counts) < 65536 and bool(glMultiDrawElementsBaseVertex)
+        index_dtype = np.uint16 if total_vertices < 65536 or use_base_vertex else np.uint32
+        index_data = np.empty(sum(index_counts), dtype=index_dtype)
+        bounds_min = np.empty((len(names), 3), dtype=np.float32)
+        bounds_max = np.empty((len(names), 3), dtype=np.float32)
+        vertex_offset = 0
+        index_offset = 0
+        for object_index, (obj_name, (mesh_vertices, mesh_normals, mesh_indices, index_count), vertex_count) in enumerate(zip(names, meshes, vertex_counts)):
+            vertex_slice = vertex_data[vertex_offset:vertex_offset + vertex_count]
+            
+            # Bake the global transform into the merged copy and rebase indices onto the
+            # object's position in the shared vertex buffer (unless drawn with a base vertex)
+            offset, scale, _ = self.get_object_transform(obj_name)
+            np.add(mesh_vertices.reshape(-1, 3), np.asarray(offset, dtype=np.float32), out=vertex_slice)
+            vertex_slice *= np.float32(scale)
+            vertex_slice.min(axis=0, out=bounds_min[object_index])
+            vertex_slice.max(axis=0, out=bounds_max[object_index])
+            normal_data[vertex_offset * 3:(vertex_offset + vertex_count) * 3] = pack_normals(mesh_normals)
+            np.add(mesh_indices, np.uint32(0 if use_base_vertex else vertex_offset),
+                   out=index_data[index_offset:index_offset + index_count], casting='unsafe')
+            
+            vertex_offset += vertex_count
+            index_offset += index_count
+        
+        interleaved, stride, normal_offset = interleave_vertex_data(vertex_data.ravel(), normal_data)
+        vertex_vbo, color_vbo, index_ibo = glGenBuffers(3)
+        glBindBuffer(GL_ARRAY_BUFFER, vertex_vbo)
+        upload_static_buffer(GL_ARRAY_BUFFER, interleaved)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, index_ibo)
+        upload_static_buffer(GL_ELEMENT_ARRAY_BUFFER, index_data)
+        
+        counts = np.array(index_counts, dtype=np.int32)
+        vertex_starts = np.cumsum(vertex_counts) - vertex_counts
+        base_vertices = vertex_starts.astype(np.int32) if use_base_vertex else None
+        byte_offsets = np.concatenate(([0], np.cumsum(counts[:-1], dtype=np.int64))) * index_data.itemsize
+        batch = {
+            'names': names,
+            'object_ids': np.array([self.get_object_id(name) for name in names], dtype=np.int64),
+            'buffers': (vertex_vbo, color_vbo, index_ibo),  # Every GL buffer of the batch, for deletion
+            'vertex_vbo': vertex_vbo,
+            'color_vbo': color_vbo,
+            'index_ibo': index_ibo,
+            'layout': (stride, normal_offset),
+            'counts': counts,
+            'byte_offsets': byte_offsets,
+            'ranges': self.get_draw_ranges(counts, byte_offsets, base_vertices),
+            'index_type': GL_ARRAY_TYPES[index_data.dtype],
+            'index_dtype': index_data.dtype,
+            'vertex_counts': np.array(vertex_counts, dtype=np.int64),
+            'base_vertices': base_vertices,
+            'base_colors': np.array(base_colors, dtype=np.float32),
+            'bounds_min': bounds_min,  # Per-object bounding boxes in batch coordinates, for culling
+            'bounds_max': bounds_max,
+            'index_data': index_data,  # Kept to build the outline edges on the first selection
+            'selection_version': None,
+        }
+        self.scene_batches[lod] = batch
+        return batch
+    
+    def update_scene_colors(self, batch):
+        """Upload per-vertex colors and the draw ranges of the current selection"""
+        selected = self.selected_mask[batch['object_ids']]
+        
+        # Dimmed for unselected, bright for selected
+        factors = np.where(selected, 1.2, 0.5).astype(np.float32)
+        colors = np.repeat(batch['base_colors'] * factors[:, None], batch['vertex_counts'], axis=0)
+        glBindBuffer(GL_ARRAY_BUFFER, batch['color_vbo'])
+        glBufferData(GL_ARRAY_BUFFER, colors.nbytes, colors, GL_DYNAMIC_DRAW)
+        
+        selected_indices = np.flatnonzero(selected)
+        batch['selected_indices'] = selected_indices
+        batch['selected_ranges'] = self.get_draw_ranges(batch['counts'], batch['byte_offsets'],
+                                                        batch['base_vertices'], selected_indices)
+        batch['outline_ranges'] = None  # Outline edges are only built when the full view draws them
+        batch['selection_version'] = self.selection_version
+    
+    def build_scene_edges(self, batch):
+        """Upload each object's distinct edges as a GL_LINES index buffer for the selection outline"""
+        # Objects occupy consecutive vertex ranges, so edges sorted by their first vertex are grouped by object
+        vertex_starts = np.cumsum(batch['vertex_counts']) - batch['vertex_counts']
+        index_data = batch.pop('index_data')
+        if batch['base_vertices'] is not None:
+            index_data = index_data + np.repeat(vertex_starts, batch['counts'])
+        edges = unique_edges(index_data, int(batch['vertex_counts'].sum()))
+        edge_starts = np.searchsorted(edges[:, 0], vertex_starts)
+        if batch['base_vertices'] is not None:
+            # Back to object-local indices, the outline is drawn with the same base vertices
+            edges -= np.repeat(vertex_starts, np.diff(edge_starts, append=len(edges)))[:, None]
+        edge_data = edges.astype(batch['index_dtype']).ravel()
+        
+        edge_ibo = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, edge_ibo)
+        upload_static_buffer(GL_ELEMENT_ARRAY_BUFFER, edge_data)
+        batch['buffers'] += (edge_ibo,)
+        batch['edge_ibo'] = edge_ibo
+        batch['edge_counts'] = (np.diff(edge_starts, append=len(edges)) * 2).astype(np.int32)
+        batch['edge_offsets'] = edge_starts * 2 * edge_data.itemsize
+    
+    def get_object_id(self, obj_name):
+        """Get the integer id of an object, its slot in selected_mask"""
+        object_id = self.object_ids.get(obj_name)
+        if object_id is None:
+            object_id = self.object_ids[obj_name] = len(self.object_ids)
+            if object_id >= len(self.selected_mask):
+                # Grow by doubling so assigning ids one by one stays linear
+                self.selected_mask = np.concatenate((self.selected_mask, np.zeros(object_id + 1, dtype=bool)))
+        return object_id
+    
+    def set_object_selected(self, obj_name, selected):
+        """Select or deselect one object, call invalidate_draw_lists afterwards"""
+        if selected:
+            self.selected_objects.add(obj_name)
+        else:
+            self.selected_objects.discard(obj_name)
+        object_id = self.get_object_id(obj_name)
+        self.selected_mask[object_id] = selected
+    
+    def set_selection(self, obj_names):
+        """Replace the selection with obj_names, call invalidate_draw_lists afterwards"""
+        self.selected_objects = set(obj_names)
+        object_ids = [self.get_object_id(obj_name) for obj_name in self.selected_objects]
+        self.selected_mask[:] = False
+        self.selected_mask[object_ids] = True
+    
+    def get_object_transform(self, obj_name):
+        """Get (global_offset, global_scale, single_scale) for an object, identity for older caches"""
+        return self.object_transforms.get(obj_name, ((0.0, 0.0, 0.0), 1.0, 1.0))
+    
+    def invalidate_draw_lists(self, geometry_changed=False):
+        """Mark scene batches stale, call after changing all_objects_data or selected_objects"""
+        self.selection_version += 1
+        if geometry_changed:
+            # Batches hold GL buffers, delete them on the next paint when the context is current
+            self.retired_buffers.extend(buffer_id for batch in self.scene_batches.values()
+                                        if batch is not None for buffer_id in batch['buffers'])
+            self.scene_batches = {}
+        
+    def set_model(self, vertices, faces, force_update=False, obj_name=None, model_id=None):
         """Set the model to display with LOD generation and GPU buffer creation"""
         # Check if this is the same model to avoid unnecessary recreation
-        if not force_update and vertices == self.vertices and faces == self.faces:
+        # (model ids come from OBJParser.get_model_id, otherwise compare by identity)
+        if not force_update and ((model_id is not None and model_id == self.model_id) or
+                                 (vertices is self.vertices and faces is self.faces)):
             # Same model, just update display
             self.update()
             return
         
+        # Meshes cached in model_buffers keep their GL buffers so switching back needs no upload,
+        # only an uncached previous mesh is freed here
+        if self.model_id is None and self.vbo_data:
+            self.release_mesh_buffers(self.vbo_data)
+        self.model_id = model_id
+        
         # Try to use cached single-object data if available
         if obj_name and hasattr(self, 'single_object_cache') and obj_name in self.single_object_cache:
             cached_verts, cached_faces, cached_vbo_data = self.single_object_cache[obj_name]
             self.vertices = cached_verts
             self.faces = cached_faces
             self.vbo_data = cached_vbo_data
+            self.model_scale = self.get_object_transform(obj_name)[2]
             # Create LOD levels from cached data for display consistency
             self.lod_levels = []
             for i, (vertex_data, normal_data, index_data, index_count) in enumerate(cached_vbo_data):
@@ -314,24 +1158,43 @@ class OBJViewer(QOpenGLWidget):
             self.update()
             return
         
+        # Position steps of the normalized meshes built below
+        position_step = 2.0 / 32767
+        
+        # Objects viewed before keep their buffers, switching back reuses the uploaded VBOs
+        if model_id is not None and model_id in self.model_buffers:
+            self.vertices, self.faces, self.vbo_data = self.model_buffers[model_id]
+            self.model_scale = position_step
+            self.lod_levels = [(self.vertices, self.faces)]
+            self.current_lod = 0
+            self.update()
+            return
+        
         # Auto-center and scale
-        if vertices:
-            verts = np.array(vertices)
-            center = np.mean(verts, axis=0)
-            centered_verts = verts - center
+        if len(vertices) > 0:
+            verts = np.asarray(vertices, dtype=np.float32)
+            center = verts.mean(axis=0)
+            scaled_verts = verts - center
             
-            # Auto-scale
-            max_dim = np.max(np.abs(centered_verts))
+            # Auto-scale in place, the centered copy is the only one made
+            max_dim = np.max(np.abs(scaled_verts))
             if max_dim > 0:
-                scale = 2.0 / max_dim
-                scaled_verts = centered_verts * scale
-            else:
-                scaled_verts = centered_verts
+                scaled_verts *= 2.0 / max_dim
+            
+            # Positions the exporter duplicated (UV and normal seams) become one vertex, compared on the
+            # int16 grid the buffers store anyway, which shrinks the buffers and shades across the seams
+            if isinstance(faces, np.ndarray) and faces.ndim == 2:
+                vertex_count = len(scaled_verts)
+                scaled_verts, faces = weld_vertices(scaled_verts, faces, position_step)
+                if len(scaled_verts) < vertex_count:
+                    print(f"  Welded {vertex_count - len(scaled_verts)} duplicate vertices")
         else:
             scaled_verts = []
         
         self.vertices = scaled_verts
         self.faces = faces
+        # Positions fit in [-2, 2] and are uploaded as int16 steps of 2 / 32767
+        self.model_scale = position_step
         
         # Skip LOD generation - use original mesh only
         print(f"Using original mesh with {len(faces)} faces...")
@@ -339,69 +1202,63 @@ class OBJViewer(QOpenGLWidget):
         
         # Create GPU buffer for original mesh only
         print("Creating GPU buffer...")
-        vertex_data, normal_data, index_data, index_count = self.create_gpu_buffers(self.vertices, self.faces)
+        vertex_data, normal_data, index_data, index_count = self.create_gpu_buffers(self.vertices, self.faces, position_step=position_step)
         self.vbo_data = [(vertex_data, normal_data, index_data, index_count)]
         print(f"  Created mesh: {len(self.vertices)} vertices, {len(self.faces)} faces, {index_count} indices")
+        if model_id is not None:
+            self.model_buffers[model_id] = (self.vertices, self.faces, self.vbo_data)
         
         self.current_lod = 0
         self.update()
     
-    def create_gpu_buffers(self, vertices, faces):
-        """Create GPU-optimized buffers from vertices and faces"""
-        if not vertices or not faces:
+    @staticmethod
+    def create_gpu_buffers(vertices, faces, position_step=None):
+        """Create GPU-optimized buffers from vertices and faces, with int16 positions when position_step is given"""
+        if len(vertices) == 0 or len(faces) == 0:
             return (np.array([], dtype=np.float32), 
-                    np.array([], dtype=np.float32), 
+                    np.array([], dtype=np.int16), 
                     np.array([], dtype=np.uint32), 0)
         
         # Convert to numpy arrays for fast processing
-        vertex_array = np.array(vertices, dtype=np.float32)
-        
-        # Build index buffer and calculate normals
-        indices = []
-        normals_list = [np.zeros(3, dtype=np.float32) for _ in range(len(vertices))]
-        
-        for face in faces:
-            if len(face) >= 3:
-                # Triangulate face (fan triangulation)
-                for i in range(len(face) - 2):
-                    idx0, idx1, idx2 = face[0], face[i + 1], face[i + 2]
-                    
-                    # Add triangle indices
-                    indices.extend([idx0, idx1, idx2])
-                    
-                    # Calculate face normal
-                    try:
-                        v0 = vertex_array[idx0]
-                        v1 = vertex_array[idx1]
-                        v2 = vertex_array[idx2]
-                        
-                        edge1 = v1 - v0
-                        edge2 = v2 - v0
-                        normal = np.cross(edge1, edge2)
-                        norm = np.linalg.norm(normal)
-                        
-                        if norm > 0:
-                            normal = normal / norm
-                            # Accumulate normals for smooth shading
-                            normals_list[idx0] += normal
-                            normals_list[idx1] += normal
-                            normals_list[idx2] += normal
-                    except (IndexError, ValueError):
-                        continue
-        
-        # Normalize accumulated normals
-        normal_array = np.zeros((len(vertices), 3), dtype=np.float32)
-        for i, normal in enumerate(normals_list):
-            norm = np.linalg.norm(normal)
-            if norm > 0:
-                normal_array[i] = normal / norm
-            else:
-                normal_array[i] = [0, 0, 1]  # Default normal
+        vertex_array = np.asarray(vertices, dtype=np.float32)
+        vertex_count = len(vertex_array)
+        
+        # Faces from OBJParser are already triangulated, anything else is fan-triangulated here
+        tris = fan_triangulate(faces)
+        
+        # Calculate vertex normals, skipping triangles with out-of-range indices
+        # (two reductions decide whether the mask and copy are needed at all)
+        if len(tris) and (tris.min() < 0 or tris.max() >= vertex_count):
+            valid_tris = tris[((tris >= 0) & (tris < vertex_count)).all(axis=1)]
+        else:
+            valid_tris = tris
+        normal_array = np.zeros((vertex_count, 3), dtype=np.float32)
         
-        # Convert to contiguous arrays for OpenGL
-        vertex_data = np.ascontiguousarray(vertex_array.flatten())
-        normal_data = np.ascontiguousarray(normal_array.flatten())
-        index_data = np.array(indices, dtype=np.uint32)
+        normals_kernel = get_numba_kernel(accumulate_vertex_normals)
+        if normals_kernel:
+            # One fused pass, no (T, 3) temporaries
+            normals_kernel(np.ascontiguousarray(vertex_array), np.ascontiguousarray(valid_tris), normal_array)
+        else:
+            tri_verts = vertex_array[valid_tris]
+            face_normals = np.cross(tri_verts[:, 1] - tri_verts[:, 0], tri_verts[:, 2] - tri_verts[:, 0])
+            normalize_rows(face_normals)
+            
+            # Accumulate normals for smooth shading (one bincount per axis)
+            corner_indices = valid_tris.ravel()
+            for axis in range(3):
+                normal_array[:, axis] = np.bincount(corner_indices, weights=np.repeat(face_normals[:, axis], 3),
+                                                    minlength=vertex_count)
+            
+            # Normalize accumulated normals
+            normalize_rows(normal_array, default=(0, 0, 1))
+        
+        # Convert to contiguous arrays for OpenGL, with int16 normals and 16-bit indices when they fit
+        if position_step:
+            vertex_data = quantize_positions(vertex_array, position_step).ravel()
+        else:
+            vertex_data = np.ascontiguousarray(vertex_array.ravel())
+        normal_data = pack_normals(normal_array.ravel())
+        index_data = tris.astype(np.uint16 if vertex_count < 65536 else np.uint32).ravel()
         
         return vertex_data, normal_data, index_data, len(index_data)
         
@@ -511,14 +1368,19 @@ class OBJViewer(QOpenGLWidget):
         """Load all objects from parser for multi-object view"""
         print("Loading all objects for multi-view...")
         
+        # Buffers of the previously loaded model are no longer needed
+        self.release_gpu_buffers()
+        
         # Try to load from cache if file_path is provided
         cache = get_cache()
         if file_path and cache.is_cached(file_path):
             cached_data = cache.load_cache(file_path)
             if cached_data:
                 self.all_objects_data = cached_data['all_objects_data']
+                self.invalidate_draw_lists(geometry_changed=True)
                 # Store single-object data for quick access
                 self.single_object_cache = cached_data.get('single_object_cache', {})
+                self.object_transforms = cached_data.get('object_transforms', {})
                 print(f"✅ Loaded {len(self.all_objects_data)} objects from cache")
                 # Set viewer to show all objects and update display
                 self.show_all_objects = True
@@ -529,8 +1391,6 @@ class OBJViewer(QOpenGLWidget):
         progress_dialog = None
         if parent_widget and len(parser.objects) > 0:
             # Create custom progress dialog with separate text display
-            from PyQt6.QtWidgets import QVBoxLayout, QLabel, QProgressBar, QPushButton
-            
             progress_dialog = QDialog(parent_widget)
             progress_dialog.setWindowTitle("Loading Model")
             progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
@@ -609,105 +1469,73 @@ class OBJViewer(QOpenGLWidget):
         
         start_time = time.time()
         self.all_objects_data = {}
+        self.invalidate_draw_lists(geometry_changed=True)
         
-        # First, collect all vertices to find global center and scale
-        all_vertices = []
+        # First, collect per-object vertex arrays and centroids to find global center and scale
         object_vertices = {}
+        object_centers = {}
+        object_bounds = {}
+        vertex_sum = np.zeros(3)
+        vertex_count = 0
         
         for obj_name in parser.objects.keys():
             vertices, faces = parser.get_object_vertices_for_display(obj_name)
-            if not vertices or not faces:
+            if len(vertices) == 0 or len(faces) == 0:
                 continue
             object_vertices[obj_name] = (vertices, faces)
-            all_vertices.extend(vertices)
+            object_sum = vertices.sum(axis=0, dtype=np.float64)
+            object_centers[obj_name] = object_sum / len(vertices)
+            object_bounds[obj_name] = (vertices.min(axis=0), vertices.max(axis=0))
+            vertex_sum += object_sum
+            vertex_count += len(vertices)
         
-        if not all_vertices:
+        if vertex_count == 0:
             # Only print message if we actually tried to load a file
             if file_path:
                 print("No objects to load")
             return
         
         # Calculate global center and scale
-        all_verts = np.array(all_vertices)
-        global_center = np.mean(all_verts, axis=0)
-        max_dim = np.max(np.abs(all_verts - global_center))
+        global_center = vertex_sum / vertex_count
+        # Farthest coordinate from the center is always at one of the per-object bounds
+        max_dim = max(max(np.max(np.abs(low - global_center)), np.max(np.abs(high - global_center)))
+                      for low, high in object_bounds.values())
+        global_scale = 2.0 / max_dim if max_dim > 0 else 1.0
         
         # Generate random colors for each object
-        import random
         random.seed(42)  # Consistent colors
         
-        # Now process each object with global transform
-        total_objects = len(object_vertices)
-        for i, (obj_name, (vertices, faces)) in enumerate(object_vertices.items()):
-            # Update progress
-            if progress_dialog:
-                progress = 20 + int((i / total_objects) * 60)  # 20-80% for object processing
-                progress_dialog.progress_bar.setValue(progress)
-                progress_dialog.status_label.setText(f"Processing objects... {progress}%")
-                
-                # Process UI events to keep dialog responsive
-                QApplication.processEvents()
-                
-                if progress_dialog.wasCanceled():
-                    print("Model loading cancelled by user")
-                    return
-            
-            # Apply global centering and scaling
-            verts = np.array(vertices)
-            centered_verts = verts - global_center
-            if max_dim > 0:
-                scaled_verts = (centered_verts / max_dim * 2).tolist()
-            else:
-                scaled_verts = centered_verts.tolist()
-            
-            # Skip LOD generation - create single GPU buffer for original mesh
-            vertex_data, normal_data, index_data, index_count = self.create_gpu_buffers(scaled_verts, faces)
-            vbo_data_list = [(vertex_data, normal_data, index_data, index_count)]
-            
-            # Assign random color
-            color = (random.uniform(0.4, 0.9), random.uniform(0.4, 0.9), random.uniform(0.4, 0.9))
-            
-            self.all_objects_data[obj_name] = (vbo_data_list, color, False)
-            print(f"  Loaded {obj_name}: {len(vertices)} vertices, {len(faces)} faces")
+        # Build the objects on a worker thread, results arrive through queued signals
+        # while a local event loop keeps the UI and progress dialog responsive
+        self.single_object_cache = {}
+        self.object_transforms = {}
+        self.load_progress_dialog = progress_dialog
+        
+        worker = MeshBuildWorker(object_vertices, object_centers, object_bounds, global_center, global_scale)
+        thread = QThread()
+        worker.moveToThread(thread)
+        loop = QEventLoop()
+        thread.started.connect(worker.process)
+        worker.object_ready.connect(self.add_built_object)
+        worker.progress.connect(self.update_load_progress)
+        worker.finished.connect(loop.quit)
+        if progress_dialog:
+            progress_dialog.rejected.connect(loop.quit)
+        
+        thread.start()
+        loop.exec()
+        worker.cancelled = True
+        thread.quit()
+        thread.wait()
+        self.load_progress_dialog = None
+        
+        if progress_dialog and progress_dialog.wasCanceled():
+            print("Model loading cancelled by user")
+            return
         
         processing_time = time.time() - start_time
         print(f"Loaded {len(self.all_objects_data)} objects with global transform in {processing_time:.2f}s")
         
-        # Generate single-object cache data (centered individually)
-        self.single_object_cache = {}
-        for i, (obj_name, (vertices, faces)) in enumerate(object_vertices.items()):
-            # Update progress
-            if progress_dialog:
-                progress = 80 + int((i / total_objects) * 15)  # 80-95% for single-object cache
-                progress_dialog.progress_bar.setValue(progress)
-                progress_dialog.status_label.setText(f"Processing objects... {progress}%")
-                
-                # Process UI events to keep dialog responsive
-                QApplication.processEvents()
-                
-                if progress_dialog.wasCanceled():
-                    print("Model loading cancelled by user")
-                    return
-            
-            # Individual centering and scaling for single objects
-            verts = np.array(vertices)
-            center = np.mean(verts, axis=0)
-            centered_verts = verts - center
-            
-            max_dim = np.max(np.abs(centered_verts))
-            if max_dim > 0:
-                scale = 2.0 / max_dim
-                scaled_verts = (centered_verts * scale).tolist()
-            else:
-                scaled_verts = centered_verts.tolist()
-            
-            # Skip LOD generation - use original mesh only for faster loading
-            # Create single GPU buffer for original mesh
-            vertex_data, normal_data, index_data, index_count = self.create_gpu_buffers(scaled_verts, faces)
-            vbo_data_list = [(vertex_data, normal_data, index_data, index_count)]
-            
-            self.single_object_cache[obj_name] = (scaled_verts, faces, vbo_data_list)
-        
         # Save to cache if file_path is provided
         if file_path:
             if progress_dialog:
@@ -719,7 +1547,8 @@ class OBJViewer(QOpenGLWidget):
             
             cache_data = {
                 'all_objects_data': self.all_objects_data,
-                'single_object_cache': self.single_object_cache
+                'single_object_cache': self.single_object_cache,
+                'object_transforms': self.object_transforms
             }
             cache.save_cache(file_path, cache_data, processing_time)
         
@@ -729,12 +1558,27 @@ class OBJViewer(QOpenGLWidget):
             progress_dialog.status_label.setText("Loading complete!")
             progress_dialog.accept()  # Use accept instead of close for proper dialog handling
     
+    def add_built_object(self, obj_name, local_verts, faces, vbo_data_list, transform):
+        """Store an object built by MeshBuildWorker (runs on the GUI thread)"""
+        # Assign random color
+        color = (random.uniform(0.4, 0.9), random.uniform(0.4, 0.9), random.uniform(0.4, 0.9))
+        
+        self.object_transforms[obj_name] = transform
+        self.all_objects_data[obj_name] = (vbo_data_list, color, False)
+        self.single_object_cache[obj_name] = (local_verts, faces, vbo_data_list)
+        self.invalidate_draw_lists(geometry_changed=True)
+        print(f"  Loaded {obj_name}: {len(local_verts)} vertices, {len(faces)} faces")
+    
+    def update_load_progress(self, progress):
+        """Show MeshBuildWorker progress in the loading dialog"""
+        if self.load_progress_dialog:
+            self.load_progress_dialog.progress_bar.setValue(progress)
+            self.load_progress_dialog.status_label.setText(f"Processing objects... {progress}%")
+    
     def toggle_object_selection(self, obj_name):
         """Toggle selection state of an object"""
-        if obj_name in self.selected_objects:
-            self.selected_objects.remove(obj_name)
-        else:
-            self.selected_objects.add(obj_name)
+        self.set_object_selected(obj_name, obj_name not in self.selected_objects)
+        self.invalidate_draw_lists()
         self.update()
     
     def set_show_all_objects(self, show):
@@ -746,58 +1590,186 @@ class OBJViewer(QOpenGLWidget):
 class OBJParser:
     """Parser for OBJ 3D model files"""
     
+    # Shared by all parsers so model ids never repeat across reloads
+    model_id_counter = itertools.count(1)
+    
+    # format_face_text only splits the face section across threads above this many faces per thread
+    min_faces_per_chunk = 100000
+    
     def __init__(self):
-        self.vertices = []
+        self.vertices = np.empty((0, 3), dtype=np.float32)
         self.faces = []
         self.objects = {}
         self.current_object = "default"
         self.materials = []
-        self.normals = []
-        self.texture_coords = []
+        self.unique_materials = set()  # Distinct names in materials, kept up to date while parsing
+        self.normals = np.empty((0, 3), dtype=np.float32)
+        self.texture_coords = np.empty((0, 2), dtype=np.float32)
+        self.triangulated = {}  # {object_name: (T, 3) array of 0-based vertex indices}
+        self.face_corners = {}  # {object_name: (face sizes, v, vt, vn) int arrays, 0-based, -1 where missing}
+        self.model_ids = {}  # {object_name: model id}
+        self.all_triangles = True  # False once a face with more than 3 corners is parsed
+        self.split_cache = None  # split_objects result, cleared by parse_file
+        self.display_cache = {}  # {object_name: (vertices, faces)} from get_object_vertices_for_display
+        self.bounds_cache = {}  # {object_name: (vertex count, min, max, mean)} from get_object_bounds
+        self.format_flags = {}  # {object_name: (has_texcoords, has_normals)} from get_format_flags
         
     def parse_file(self, file_path):
         """Parse OBJ file and extract data"""
+        self.split_cache = None
+        self.display_cache = {}
+        self.bounds_cache = {}
+        self.format_flags = {}
         try:
+            # Read the whole file and convert coordinate lines in bulk,
+            # only faces, objects and materials need per-line Python work
+            object_refs = {}  # {object_name: (face sizes, v, vt, vn) int buffers}
+            corner_table = {}  # {corner token: (v, vt, vn)}, shared corners are only parsed once
+            
+            # With numba the face lines are kept as they are and their corners parsed in one compiled pass
+            face_kernel = get_numba_kernel(parse_face_corners)
+            object_face_lines = {}  # {object_name: face lines}
+            
             with open(file_path, 'r', encoding='utf-8') as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
+                text = file.read()
+            lines = text.split('\n')
+            if text[:1] in (' ', '\t') or '\n ' in text or '\n\t' in text:
+                # Indented lines are rare, only then strip them
+                lines = [line.strip() if line[:1] in (' ', '\t') else line for line in lines]
+            
+            # Lines come in long runs of one kind, so they are grouped by their first two
+            # characters in C and each run is handled as a whole
+            vertex_lines = []
+            normal_lines = []
+            texture_lines = []
+            
+            # Face token lists hold only strings and never form cycles, pause the cyclic
+            # collector so it does not rescan them over and over while they are created
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                for kind, run in itertools.groupby(lines, itemgetter(slice(0, 2))):
+                    if kind == 'v ' or kind == 'v\t':  # Vertex
+                        vertex_lines.extend(run)
+                    elif kind == 'vn':  # Vertex normal
+                        normal_lines.extend(run)
+                    elif kind == 'vt':  # Texture coordinate
+                        texture_lines.extend(run)
+                    elif kind == 'f ' or kind == 'f\t' or kind == 'f':  # Face
+                        face_lines = list(run)
+                        face_run = [line[2:].split() for line in face_lines]
+                        self.faces.extend(face_run)
+                        self.objects.setdefault(self.current_object, []).extend(face_run)
                         
-                    parts = line.split()
-                    if not parts:
-                        continue
+                        if face_kernel:
+                            object_face_lines.setdefault(self.current_object, []).extend(face_lines)
+                            continue
                         
-                    command = parts[0]
-                    
-                    if command == 'v':  # Vertex
-                        if len(parts) >= 4:
-                            self.vertices.append((float(parts[1]), float(parts[2]), float(parts[3])))
-                    elif command == 'vn':  # Vertex normal
-                        if len(parts) >= 4:
-                            self.normals.append((float(parts[1]), float(parts[2]), float(parts[3])))
-                    elif command == 'vt':  # Texture coordinate
-                        if len(parts) >= 3:
-                            self.texture_coords.append((float(parts[1]), float(parts[2])))
-                    elif command == 'f':  # Face
-                        face_data = parts[1:]
-                        self.faces.append(face_data)
-                        if self.current_object not in self.objects:
-                            self.objects[self.current_object] = []
-                        self.objects[self.current_object].append(face_data)
-                    elif command == 'o' or command == 'g':  # Object or Group
-                        if len(parts) > 1:
-                            self.current_object = parts[1]
-                        else:
-                            self.current_object = f"object_{len(self.objects)}"
-                    elif command == 'usemtl':  # Material
-                        self.materials.append(parts[1])
+                        # Keep every corner's v/vt/vn indices so split and export never re-parse strings
+                        refs = object_refs.get(self.current_object)
+                        if refs is None:
+                            refs = object_refs[self.current_object] = (array('i'), array('i'), array('i'), array('i'))
+                        self.append_face_refs(face_run, refs, corner_table)
+                    elif kind[:1] == 'o' or kind[:1] == 'g' or kind[:1] == 'u':
+                        for line in run:
+                            parts = line.split()
+                            command = parts[0]
+                            if command == 'o' or command == 'g':  # Object or Group
+                                if len(parts) > 1:
+                                    self.current_object = parts[1]
+                                else:
+                                    self.current_object = f"object_{len(self.objects)}"
+                            elif command == 'usemtl':  # Material
+                                self.materials.append(parts[1])
+                                self.unique_materials.add(parts[1])
+                    # Anything else (comments, blank lines, unused statements) is skipped
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            
+            self.vertices = self.parse_coordinate_lines(vertex_lines, 3)
+            self.normals = self.parse_coordinate_lines(normal_lines, 3)
+            self.texture_coords = self.parse_coordinate_lines(texture_lines, 2)
+            self.face_corners = {name: tuple(np.frombuffer(buffer, dtype=np.intc) for buffer in refs)
+                                 for name, refs in object_refs.items()}
+            for name, face_lines in object_face_lines.items():
+                self.face_corners[name] = self.parse_face_lines(face_kernel, face_lines)
+            
+            # Fan-triangulate once here so display and LOD code never walk face strings
+            for name, (face_sizes, v_refs, _, _) in self.face_corners.items():
+                has_vertex = v_refs >= 0
+                vertices_before = np.concatenate(([0], np.cumsum(has_vertex)))
+                face_ends = np.cumsum(face_sizes)
+                vertex_counts = vertices_before[face_ends] - vertices_before[face_ends - face_sizes]
+                if (vertex_counts > 3).any():
+                    self.all_triangles = False
+                triangles = fan_triangulate_flat(vertex_counts, v_refs[has_vertex])
+                if len(triangles):
+                    self.triangulated[name] = triangles
                         
             return True
         except Exception as e:
             print(f"Error parsing file: {e}")
             return False
     
+    @staticmethod
+    def append_face_refs(face_run, refs, corner_table):
+        """Append the corner counts and 0-based v/vt/vn indices of tokenized faces to (face sizes, v, vt, vn) int arrays"""
+        face_sizes, v_refs, vt_refs, vn_refs = refs
+        for face_data in face_run:
+            face_sizes.append(len(face_data))
+            for vertex_data in face_data:
+                corner = corner_table.get(vertex_data)
+                if corner is None:
+                    vertex_ref, _, rest = vertex_data.partition('/')
+                    tex_ref, _, rest = rest.partition('/')
+                    normal_ref = rest.partition('/')[0]
+                    corner = corner_table[vertex_data] = (parse_face_reference(vertex_ref) if vertex_ref else -1,
+                                                          parse_face_reference(tex_ref) if tex_ref else -1,
+                                                          parse_face_reference(normal_ref) if normal_ref else -1)
+                v_refs.append(corner[0])
+                vt_refs.append(corner[1])
+                vn_refs.append(corner[2])
+    
+    @staticmethod
+    def parse_face_lines(face_kernel, face_lines):
+        """Run the compiled face parser over one object's face lines, giving (face sizes, v, vt, vn) arrays"""
+        text = '\n'.join(face_lines)
+        
+        # The kernel only knows ASCII separators, faces with other str.split() whitespace
+        # (NBSP, Unicode spaces, \x1c-\x1f) are tokenized in Python like the rest of the parser
+        if not text.isascii() or re.search('[\x1c-\x1f]', text):
+            refs = (array('i'), array('i'), array('i'), array('i'))
+            OBJParser.append_face_refs([line[2:].split() for line in face_lines], refs, {})
+            return tuple(np.frombuffer(buffer, dtype=np.intc) for buffer in refs)
+        data = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        
+        # Every corner starts after a separator, which bounds the corner count
+        is_space = (data == 32) | ((data >= 9) & (data <= 13))
+        max_corners = int(np.count_nonzero(is_space[:-1] & ~is_space[1:]))
+        face_sizes = np.empty(len(face_lines), dtype=np.intc)
+        v_refs, vt_refs, vn_refs = (np.empty(max_corners, dtype=np.intc) for _ in range(3))
+        corner_count = face_kernel(data, face_sizes, v_refs, vt_refs, vn_refs)
+        return face_sizes, v_refs[:corner_count], vt_refs[:corner_count], vn_refs[:corner_count]
+    
+    @staticmethod
+    def parse_coordinate_lines(lines, count):
+        """Convert 'v'/'vn'/'vt' lines to an (N, count) float32 array of their first count coordinates"""
+        if not lines:
+            return np.empty((0, count), dtype=np.float32)
+        
+        columns = tuple(range(1, count + 1))
+        try:
+            return np.loadtxt(lines, usecols=columns, ndmin=2, dtype=np.float32)
+        except ValueError:
+            # Some lines are short or malformed, skip short ones like the line-by-line parser did
+            coords = []
+            for line in lines:
+                parts = line.split()
+                if len(parts) > count:
+                    coords.append([float(parts[i]) for i in columns])
+            return np.array(coords, dtype=np.float32).reshape(-1, count)
+    
     def get_statistics(self):
         """Get file statistics"""
         stats = {
@@ -806,108 +1778,162 @@ class OBJParser:
             'objects': len(self.objects),
             'normals': len(self.normals),
             'texture_coords': len(self.texture_coords),
-            'materials': len(set(self.materials))
+            'materials': len(self.unique_materials)
         }
         return stats
     
     def split_objects(self):
         """Split objects into separate data structures"""
+        if self.split_cache is not None:
+            return self.split_cache
+        
         split_data = {}
         
-        for obj_name, obj_faces in self.objects.items():
-            # Find all vertices used by this object
-            used_vertices = set()
-            used_normals = set()
-            used_tex_coords = set()
-            
-            for face in obj_faces:
-                for vertex_data in face:
-                    # Parse vertex data (v/vt/vn format)
-                    parts = vertex_data.split('/')
-                    if parts[0]:  # Vertex index
-                        used_vertices.add(int(parts[0]) - 1)  # OBJ indices are 1-based
-                    if len(parts) > 1 and parts[1]:  # Texture coordinate
-                        used_tex_coords.add(int(parts[1]) - 1)
-                    if len(parts) > 2 and parts[2]:  # Normal
-                        used_normals.add(int(parts[2]) - 1)
-            
-            # Create remapped indices
-            vertex_map = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted(used_vertices))}
-            normal_map = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted(used_normals))}
-            tex_coord_map = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted(used_tex_coords))}
-            
-            # Remap faces
-            remapped_faces = []
-            for face in obj_faces:
-                remapped_face = []
-                for vertex_data in face:
-                    parts = vertex_data.split('/')
-                    new_data = []
-                    
-                    if parts[0]:  # Vertex
-                        new_data.append(str(vertex_map[int(parts[0]) - 1] + 1))
-                    else:
-                        new_data.append('')
-                    
-                    if len(parts) > 1:
-                        if parts[1]:  # Texture coordinate
-                            new_data.append(str(tex_coord_map[int(parts[1]) - 1] + 1))
-                        else:
-                            new_data.append('')
-                    else:
-                        new_data.append('')
-                    
-                    if len(parts) > 2:
-                        if parts[2]:  # Normal
-                            new_data.append(str(normal_map[int(parts[2]) - 1] + 1))
-                        else:
-                            new_data.append('')
-                    else:
-                        new_data.append('')
-                    
-                    remapped_face.append('/'.join(new_data))
-                remapped_faces.append(remapped_face)
+        for obj_name, (face_sizes, v_refs, vt_refs, vn_refs) in self.face_corners.items():
+            # Find all vertices used by this object and remap the corners to them
+            has_texcoords, has_normals = self.get_format_flags(obj_name)
+            used_vertices, v_new = self.remap_references(v_refs)
+            used_tex_coords, vt_new = self.remap_references(vt_refs) if has_texcoords else self.no_references(len(vt_refs))
+            used_normals, vn_new = self.remap_references(vn_refs) if has_normals else self.no_references(len(vn_refs))
             
             split_data[obj_name] = {
-                'vertices': [self.vertices[i] for i in sorted(used_vertices)],
-                'faces': remapped_faces,
-                'normals': [self.normals[i] for i in sorted(used_normals)] if used_normals else [],
-                'texture_coords': [self.texture_coords[i] for i in sorted(used_tex_coords)] if used_tex_coords else [],
-                'vertex_indices': sorted(used_vertices)
+                'vertices': self.vertices[used_vertices],
+                'faces': self.format_face_corners(face_sizes, v_new, vt_new, vn_new),
+                'normals': self.normals[used_normals],
+                'texture_coords': self.texture_coords[used_tex_coords],
+                'vertex_indices': used_vertices
             }
         
+        self.split_cache = split_data
         return split_data
     
+    @staticmethod
+    def remap_references(refs):
+        """Sorted used indices and 1-based references into them, 0 where a corner has no reference"""
+        present = refs >= 0
+        used, positions = compact_indices(refs[present])
+        remapped = np.zeros(len(refs), dtype=np.int64)
+        remapped[present] = positions + 1
+        return used, remapped
+    
+    @staticmethod
+    def no_references(count):
+        """remap_references result for corners that never reference the data"""
+        return np.empty(0, dtype=np.int64), np.zeros(count, dtype=np.int64)
+    
+    def get_format_flags(self, obj_name):
+        """Get (has_texcoords, has_normals) of an object's faces, detected once per object"""
+        flags = self.format_flags.get(obj_name)
+        if flags is None:
+            _, _, vt_refs, vn_refs = self.face_corners[obj_name]
+            flags = self.format_flags[obj_name] = (bool((vt_refs >= 0).any()), bool((vn_refs >= 0).any()))
+        return flags
+    
+    @staticmethod
+    def format_face_corners(face_sizes, v_new, vt_new, vn_new):
+        """Build 'v/vt/vn' face strings from remapped corner references"""
+        def corner_text(refs):
+            return [str(ref) if ref else '' for ref in refs.tolist()]
+        
+        corners = iter(list(map('{}/{}/{}'.format, corner_text(v_new), corner_text(vt_new), corner_text(vn_new))))
+        return [list(itertools.islice(corners, size)) for size in face_sizes.tolist()]
+    
+    @staticmethod
+    def format_face_lines(face_sizes, v_new, vt_new, vn_new, has_texcoords, has_normals):
+        """Build printable 'f ...' lines from remapped corner references, formatting each distinct corner once"""
+        # Corners without a vertex are dropped, faces left with fewer than 3 corners are not written
+        kept = v_new > 0
+        kept_before = np.concatenate(([0], np.cumsum(kept)))
+        face_ends = np.cumsum(face_sizes)
+        kept_sizes = kept_before[face_ends] - kept_before[face_ends - face_sizes]
+        
+        # Only write the references the file has, decided once instead of per corner
+        corner_keys = np.stack((v_new, vt_new if has_texcoords else np.zeros_like(v_new),
+                                vn_new if has_normals else np.zeros_like(v_new)), axis=1)[kept]
+        unique_corners, corner_inverse = np.unique(corner_keys, axis=0, return_inverse=True)
+        if has_texcoords and has_normals:
+            # Full format keeps empty slots, e.g. '5//'
+            corner_texts = [f"{v}/{vt or ''}/{vn or ''}" for v, vt, vn in unique_corners.tolist()]
+        else:
+            corner_texts = [f"{v}/{vt}" if vt else f"{v}//{vn}" if vn else str(v) for v, vt, vn in unique_corners.tolist()]
+        
+        corners = iter(np.array(corner_texts, dtype=object)[corner_inverse.ravel()].tolist())
+        lines = []
+        for size in kept_sizes.tolist():
+            face = ' '.join(itertools.islice(corners, size))
+            if size >= 3:
+                lines.append(f"f {face}\n")
+        return lines
+    
+    @staticmethod
+    def format_face_text(face_sizes, v_new, vt_new, vn_new, has_texcoords, has_normals):
+        """Build the printable face section as one string, with the compiled writer when numba is available"""
+        face_writer = get_numba_kernel(format_face_bytes)
+        if not face_writer:
+            return ''.join(OBJParser.format_face_lines(face_sizes, v_new, vt_new, vn_new, has_texcoords, has_normals))
+        
+        # Each corner takes at most three references, two slashes and a space, each face 'f' and a newline
+        largest = max((int(refs.max()) for refs in (v_new, vt_new, vn_new) if len(refs)), default=0)
+        corner_bytes = 3 * len(str(largest)) + 3
+        
+        # Faces are independent, so large sections are split at face boundaries and
+        # written on several threads, the compiled writer runs without the GIL
+        chunk_count = max(1, min(os.cpu_count() or 1, len(face_sizes) // OBJParser.min_faces_per_chunk))
+        face_bounds = np.linspace(0, len(face_sizes), chunk_count + 1).astype(np.intp).tolist()
+        corner_bounds = np.concatenate(([0], np.cumsum(face_sizes, dtype=np.int64)))[face_bounds].tolist()
+        
+        def write_chunk(chunk):
+            face_start, face_end = face_bounds[chunk], face_bounds[chunk + 1]
+            corner_start, corner_end = corner_bounds[chunk], corner_bounds[chunk + 1]
+            out = np.empty((corner_end - corner_start) * corner_bytes + (face_end - face_start) * 2, dtype=np.uint8)
+            written = face_writer(face_sizes[face_start:face_end], v_new[corner_start:corner_end],
+                                  vt_new[corner_start:corner_end], vn_new[corner_start:corner_end],
+                                  has_texcoords, has_normals, out)
+            # Decode straight from the array buffer, tobytes() would copy the whole section once more
+            return str(memoryview(out)[:written], 'ascii')
+        
+        if chunk_count == 1:
+            return write_chunk(0)
+        with ThreadPoolExecutor(max_workers=chunk_count) as executor:
+            return ''.join(executor.map(write_chunk, range(chunk_count)))
+    
+    def get_model_id(self, obj_name):
+        """Get an integer id for an object's display mesh, unique across parsers"""
+        model_id = self.model_ids.get(obj_name)
+        if model_id is None:
+            model_id = next(OBJParser.model_id_counter)
+            self.model_ids[obj_name] = model_id
+        return model_id
+    
+    def get_object_bounds(self, obj_name):
+        """Get (used vertex count, min, max, mean) of an object's vertices, computed once per object"""
+        bounds = self.bounds_cache.get(obj_name)
+        if bounds is None:
+            v_refs = self.face_corners[obj_name][1] if obj_name in self.face_corners else np.empty(0, dtype=np.intc)
+            used_vertices, _ = compact_indices(v_refs[v_refs >= 0])
+            if len(used_vertices):
+                verts = self.vertices[used_vertices]
+                bounds = (len(used_vertices), verts.min(axis=0), verts.max(axis=0), verts.mean(axis=0, dtype=np.float64))
+            else:
+                bounds = (0, None, None, None)
+            self.bounds_cache[obj_name] = bounds
+        return bounds
+    
     def get_object_vertices_for_display(self, obj_name):
         """Get vertices and faces for OpenGL display"""
-        if obj_name not in self.objects:
+        cached = self.display_cache.get(obj_name)
+        if cached is not None:
+            return cached
+        
+        triangles = self.triangulated.get(obj_name)
+        if obj_name not in self.objects or triangles is None:
             return [], []
-            
-        obj_faces = self.objects[obj_name]
-        used_vertices = set()
-        
-        for face in obj_faces:
-            for vertex_data in face:
-                parts = vertex_data.split('/')
-                if parts[0]:
-                    used_vertices.add(int(parts[0]) - 1)
-        
-        # Create vertex map
-        vertex_map = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted(used_vertices))}
-        vertices = [self.vertices[i] for i in sorted(used_vertices)]
-        
-        # Convert faces to index lists
-        faces = []
-        for face in obj_faces:
-            face_indices = []
-            for vertex_data in face:
-                parts = vertex_data.split('/')
-                if parts[0]:
-                    old_idx = int(parts[0]) - 1
-                    face_indices.append(vertex_map[old_idx])
-            if len(face_indices) >= 3:
-                faces.append(face_indices)
-                
+        
+        # Used vertices and faces remapped to them, straight from the triangulated faces
+        used_vertices, faces = compact_indices(triangles)
+        vertices = self.vertices[used_vertices]
+        
+        self.display_cache[obj_name] = (vertices, faces)
         return vertices, faces
 
 
@@ -930,6 +1956,7 @@ class OBJProcessorApp(QMainWindow):
         self.parser = OBJParser()
         self.current_file = None
         self.split_data = {}
+        self.details_cache = {}  # {object_name: details text}, cleared when a file is loaded
         
         # Enable drag and drop
         self.setAcceptDrops(True)
@@ -1142,6 +2169,10 @@ class OBJProcessorApp(QMainWindow):
         # Status bar
         self.statusBar().showMessage('Ready - Material Design 3 Light Theme')
         
+        # Last settings written to (or read from) disk, to skip unchanged saves
+        self.last_saved_settings = None
+        self.settings_file = None  # Resolved once by get_settings_file
+        
         # Restore UI state after all components are initialized
         self.restore_splitter_state()
         
@@ -1163,12 +2194,15 @@ class OBJProcessorApp(QMainWindow):
         
         # Reset parser
         self.parser = OBJParser()
+        self.details_cache = {}
         
         # Reset viewer state
         self.viewer.all_objects_data = {}
-        self.viewer.selected_objects.clear()
+        self.viewer.set_selection(())
+        self.viewer.invalidate_draw_lists(geometry_changed=True)
         self.viewer.show_all_objects = False
         self.viewer.vbo_data = []
+        self.viewer.model_buffers = {}
         self.viewer.vertices = []
         self.viewer.faces = []
         
@@ -1244,24 +2278,19 @@ Materials: {stats['materials']}"""
         # In show-all mode, clicking text just shows details (no selection change)
         # In single-object mode, clicking shows the object in 3D viewer
         
-        # Calculate object-specific statistics
-        used_vertices = set()
-        for face in obj_faces:
-            for vertex_data in face:
-                parts = vertex_data.split('/')
-                if parts[0]:
-                    used_vertices.add(int(parts[0]) - 1)
-        
-        # Get bounds
-        if used_vertices:
-            verts = np.array([self.parser.vertices[i] for i in used_vertices])
-            min_bounds = np.min(verts, axis=0)
-            max_bounds = np.max(verts, axis=0)
-            size = max_bounds - min_bounds
+        # Details only depend on the parsed file, build them once per object
+        details = self.details_cache.get(obj_name)
+        if details is None:
+            # Calculate object-specific statistics (cached by the parser)
+            vertex_count, min_bounds, max_bounds, _ = self.parser.get_object_bounds(obj_name)
+        
+            # Get bounds
+            if vertex_count:
+                size = max_bounds - min_bounds
             
-            details = f"""Object: {obj_name}
+                details = f"""Object: {obj_name}
 Faces: {len(obj_faces)}
-Vertices: {len(used_vertices)}
+Vertices: {vertex_count}
 
 Object Size:
   Dimensions (X×Y×Z): {size[0]:.3f} × {size[1]:.3f} × {size[2]:.3f}
@@ -1275,8 +2304,8 @@ Bounding Box:
 
 First 10 faces:
 """
-        else:
-            details = f"""Object: {obj_name}
+            else:
+                details = f"""Object: {obj_name}
 Faces: {len(obj_faces)}
 Vertices: 0
 
@@ -1288,18 +2317,25 @@ Object Size:
 First 10 faces:
 """
             
-        for i, face in enumerate(obj_faces[:10]):
-            details += f"  {i+1}: {' '.join(face)}\n"
+            for i, face in enumerate(obj_faces[:10]):
+                details += f"  {i+1}: {' '.join(face)}\n"
         
-        if len(obj_faces) > 10:
-            details += f"... and {len(obj_faces) - 10} more faces\n"
+            if len(obj_faces) > 10:
+                details += f"... and {len(obj_faces) - 10} more faces\n"
+        
+            self.details_cache[obj_name] = details
         
         self.details_text.setText(details)
         
         # Update 3D viewer only in single-object mode
         if not self.show_all_button.isChecked():
-            vertices, faces = self.parser.get_object_vertices_for_display(obj_name)
-            self.viewer.set_model(vertices, faces, obj_name=obj_name)
+            model_id = self.parser.get_model_id(obj_name)
+            if model_id == self.viewer.model_id:
+                # Same object clicked again, nothing to rebuild
+                self.viewer.update()
+            else:
+                vertices, faces = self.parser.get_object_vertices_for_display(obj_name)
+                self.viewer.set_model(vertices, faces, obj_name=obj_name, model_id=model_id)
             self.statusBar().showMessage(f'Viewing: {obj_name}')
     
     def on_object_checkbox_changed(self, item):
@@ -1313,10 +2349,8 @@ First 10 faces:
         
         if not self.show_all_button.isChecked():
             # In single-object mode, checkboxes control which objects to display
-            if item.checkState() == Qt.CheckState.Checked:
-                self.viewer.selected_objects.add(obj_name)
-            else:
-                self.viewer.selected_objects.discard(obj_name)
+            self.viewer.set_object_selected(obj_name, item.checkState() == Qt.CheckState.Checked)
+            self.viewer.invalidate_draw_lists()
             
             # Update display to show selected objects
             self.viewer.update()
@@ -1324,41 +2358,68 @@ First 10 faces:
             # Auto LOD functionality removed - always using highest quality
             
             # Update status message
-            selected_count = len(self.viewer.selected_objects)
-            if selected_count == 0:
-                self.statusBar().showMessage('Single Object View - Check objects to display')
-            elif selected_count == 1:
-                self.statusBar().showMessage(f'Single Object View - Displaying 1 object')
-            else:
-                self.statusBar().showMessage(f'Single Object View - Displaying {selected_count} objects')
+            self.show_single_view_status()
             return
         
         # Update viewer selection based on checkbox state
         if item.checkState() == Qt.CheckState.Checked:
             if obj_name not in self.viewer.selected_objects:
-                self.viewer.selected_objects.add(obj_name)
+                self.viewer.set_object_selected(obj_name, True)
+                self.viewer.invalidate_draw_lists()
                 self.viewer.update()
         else:
             if obj_name in self.viewer.selected_objects:
-                self.viewer.selected_objects.remove(obj_name)
+                self.viewer.set_object_selected(obj_name, False)
+                self.viewer.invalidate_draw_lists()
                 self.viewer.update()
     
+    def show_single_view_status(self):
+        """Show how many objects the single object view displays"""
+        selected_count = len(self.viewer.selected_objects)
+        if selected_count == 0:
+            self.statusBar().showMessage('Single Object View - Check objects to display')
+        elif selected_count == 1:
+            self.statusBar().showMessage(f'Single Object View - Displaying 1 object')
+        else:
+            self.statusBar().showMessage(f'Single Object View - Displaying {selected_count} objects')
+    
     def select_all_objects(self):
         """Select all objects"""
-        for i in range(self.objects_list.count()):
-            item = self.objects_list.item(i)
-            item.setCheckState(Qt.CheckState.Checked)
+        self.set_all_objects_checked(Qt.CheckState.Checked)
         
         # Auto LOD functionality removed - always using highest quality
     
     def select_no_objects(self):
         """Deselect all objects"""
-        for i in range(self.objects_list.count()):
-            item = self.objects_list.item(i)
-            item.setCheckState(Qt.CheckState.Unchecked)
+        self.set_all_objects_checked(Qt.CheckState.Unchecked)
         
         # Auto LOD functionality removed - always using highest quality
     
+    def set_all_objects_checked(self, state):
+        """Check or uncheck every object, updating the viewer once instead of once per itemChanged"""
+        self.objects_list.blockSignals(True)
+        try:
+            for i in range(self.objects_list.count()):
+                self.objects_list.item(i).setCheckState(state)
+        finally:
+            self.objects_list.blockSignals(False)
+        
+        # Disable if no file is loaded
+        if not self.current_file or len(self.parser.objects) == 0:
+            self.statusBar().showMessage('Please load an OBJ file first')
+            return
+        
+        if state == Qt.CheckState.Checked:
+            self.viewer.set_selection(self.objects_list.item(i).data(Qt.ItemDataRole.UserRole)
+                                      for i in range(self.objects_list.count()))
+        else:
+            self.viewer.set_selection(())
+        self.viewer.invalidate_draw_lists()
+        self.viewer.update()
+        
+        if not self.show_all_button.isChecked():
+            self.show_single_view_status()
+    
     def toggle_show_all(self, checked):
         """Toggle between single object and all objects view"""
         # Disable mode switching if no file is loaded
@@ -1386,7 +2447,8 @@ First 10 faces:
         else:
             self.show_all_button.setText('Single Object')
             # Clear viewer selections when switching to single mode
-            self.viewer.selected_objects.clear()
+            self.viewer.set_selection(())
+            self.viewer.invalidate_draw_lists()
             # Clear all checkbox selections for clean start
             for i in range(self.objects_list.count()):
                 self.objects_list.item(i).setCheckState(Qt.CheckState.Unchecked)
@@ -1472,138 +2534,80 @@ First 10 faces:
     
     def export_printable_obj(self, object_names, output_path):
         """Export objects as a printable OBJ file with correct format and ground placement"""
-        # Collect all faces and vertices from selected objects
-        all_faces = []
-        used_vertices = set()
-        used_normals = set()
-        used_tex_coords = set()
-        
-        for obj_name in object_names:
-            if obj_name in self.parser.objects:
-                obj_faces = self.parser.objects[obj_name]
-                all_faces.extend(obj_faces)
-                
-                for face in obj_faces:
-                    for vertex_data in face:
-                        parts = vertex_data.split('/')
-                        if parts[0]:
-                            used_vertices.add(int(parts[0]) - 1)
-                        if len(parts) > 1 and parts[1]:
-                            used_tex_coords.add(int(parts[1]) - 1)
-                        if len(parts) > 2 and parts[2]:
-                            used_normals.add(int(parts[2]) - 1)
+        # Identical re-exports (same source file, selection and options) are copied
+        # from the export cache instead of being regenerated
+        cache = get_cache()
+        try:
+            source_stat = os.stat(self.current_file)
+            export_key = hashlib.blake2b(repr((
+                os.path.abspath(self.current_file), source_stat.st_mtime_ns, source_stat.st_size,
+                list(object_names), self.ground_checkbox.isChecked()
+            )).encode('utf-8'), digest_size=16).hexdigest()
+        except OSError:
+            export_key = None
+        
+        if export_key is not None and cache.load_export(export_key, output_path):
+            QMessageBox.information(self, 'Export Complete', f'Exported to:\n{output_path}')
+            self.statusBar().showMessage(f'Exported to: {output_path}')
+            return
+        
+        # Collect the corner references of the selected objects into one set of arrays,
+        # so used indices and remapping are computed once for the whole selection
+        face_corners = [self.parser.face_corners[obj_name] for obj_name in object_names if obj_name in self.parser.face_corners]
+        if len(face_corners) == 1:
+            face_sizes, v_refs, vt_refs, vn_refs = face_corners[0]  # Nothing to merge, skip the copies
+        else:
+            face_sizes, v_refs, vt_refs, vn_refs = (np.concatenate(column) for column in zip(*face_corners))
+        
+        # Which references the selection has is known per object, skip remapping absent ones
+        format_flags = [self.parser.get_format_flags(obj_name) for obj_name in object_names if obj_name in self.parser.face_corners]
+        has_texcoords = any(flags[0] for flags in format_flags)
+        has_normals = any(flags[1] for flags in format_flags)
+        used_vertices, v_new = self.parser.remap_references(v_refs)
+        used_tex_coords, vt_new = self.parser.remap_references(vt_refs) if has_texcoords else self.parser.no_references(len(vt_refs))
+        used_normals, vn_new = self.parser.remap_references(vn_refs) if has_normals else self.parser.no_references(len(vn_refs))
         
         # Get vertices
-        vertices = np.array([self.parser.vertices[i] for i in sorted(used_vertices)])
+        vertices = self.parser.vertices[used_vertices]
         
-        # Apply ground placement if requested
+        # Apply ground placement if requested, a single object reuses its cached bounds
         if self.ground_checkbox.isChecked():
-            min_z = np.min(vertices[:, 2])
-            center_x = np.mean(vertices[:, 0])
-            center_y = np.mean(vertices[:, 1])
-            vertices[:, 0] -= center_x
-            vertices[:, 1] -= center_y
-            vertices[:, 2] -= min_z
-        
-        # Create remapping
-        vertex_map = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted(used_vertices))}
-        normal_map = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted(used_normals))}
-        tex_coord_map = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted(used_tex_coords))}
-        
-        # Remap faces
-        remapped_faces = []
-        for face in all_faces:
-            remapped_face = []
-            for vertex_data in face:
-                parts = vertex_data.split('/')
-                new_data = []
-                
-                if parts[0]:
-                    new_data.append(str(vertex_map[int(parts[0]) - 1] + 1))
-                else:
-                    new_data.append('')
-                
-                if len(parts) > 1:
-                    if parts[1]:
-                        new_data.append(str(tex_coord_map[int(parts[1]) - 1] + 1))
-                    else:
-                        new_data.append('')
-                else:
-                    new_data.append('')
-                
-                if len(parts) > 2:
-                    if parts[2]:
-                        new_data.append(str(normal_map[int(parts[2]) - 1] + 1))
-                    else:
-                        new_data.append('')
-                else:
-                    new_data.append('')
-                
-                remapped_face.append('/'.join(new_data))
-            remapped_faces.append(remapped_face)
-        
-        # Write file with printable format
-        has_normals = len(used_normals) > 0
-        has_texcoords = len(used_tex_coords) > 0
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(f"# Printable OBJ exported from: {self.current_file}\n")
-            f.write(f"# Objects: {', '.join(object_names)}\n")
-            f.write(f"# Vertices: {len(vertices)}\n")
-            f.write(f"# Faces: {len(remapped_faces)}\n")
-            if self.ground_checkbox.isChecked():
-                f.write(f"# Positioned on ground plane (Z=0) and centered at origin\n")
-            f.write("\n")
+            if len(object_names) == 1:
+                _, low, _, center = self.parser.get_object_bounds(object_names[0])
+            else:
+                low = vertices.min(axis=0)
+                center = vertices.mean(axis=0, dtype=np.float64)
+            vertices -= (center[0], center[1], low[2])
+        
+        # Each block is formatted in one pass and written with a single call
+        header = [f"# Printable OBJ exported from: {self.current_file}\n",
+                  f"# Objects: {', '.join(object_names)}\n",
+                  f"# Vertices: {len(vertices)}\n",
+                  f"# Faces: {len(face_sizes)}\n"]
+        if self.ground_checkbox.isChecked():
+            header.append("# Positioned on ground plane (Z=0) and centered at origin\n")
+        header.append("\n")
+        
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(''.join(header))
             
             # Write vertices
-            for v in vertices:
-                f.write(f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n")
+            f.write(format_rows("v %.6f %.6f %.6f\n", vertices))
             
             # Write texture coordinates if any
             if has_texcoords:
-                f.write("\n")
-                for i in sorted(used_tex_coords):
-                    vt = self.parser.texture_coords[i]
-                    f.write(f"vt {vt[0]:.6f} {vt[1]:.6f}\n")
+                f.write("\n" + format_rows("vt %.6f %.6f\n", self.parser.texture_coords[used_tex_coords]))
             
             # Write normals if any
             if has_normals:
-                f.write("\n")
-                for i in sorted(used_normals):
-                    vn = self.parser.normals[i]
-                    f.write(f"vn {vn[0]:.6f} {vn[1]:.6f} {vn[2]:.6f}\n")
+                f.write("\n" + format_rows("vn %.6f %.6f %.6f\n", self.parser.normals[used_normals]))
             
             # Write faces with correct format
-            f.write("\n")
-            f.write(f"o PrintableObject\n")
-            
-            for face in remapped_faces:
-                # Clean face format based on available data
-                clean_face = []
-                for vertex_data in face:
-                    parts = vertex_data.split('/')
-                    if parts[0]:
-                        if not has_texcoords and not has_normals:
-                            # Simple vertex-only format
-                            clean_face.append(parts[0])
-                        elif has_texcoords and not has_normals:
-                            # vertex/texture format
-                            if len(parts) > 1 and parts[1]:
-                                clean_face.append(f"{parts[0]}/{parts[1]}")
-                            else:
-                                clean_face.append(parts[0])
-                        elif not has_texcoords and has_normals:
-                            # vertex//normal format
-                            if len(parts) > 2 and parts[2]:
-                                clean_face.append(f"{parts[0]}//{parts[2]}")
-                            else:
-                                clean_face.append(parts[0])
-                        else:
-                            # Full format
-                            clean_face.append(vertex_data)
-                
-                if len(clean_face) >= 3:
-                    f.write(f"f {' '.join(clean_face)}\n")
+            f.write("\no PrintableObject\n")
+            f.write(self.parser.format_face_text(face_sizes, v_new, vt_new, vn_new, has_texcoords, has_normals))
+        
+        if export_key is not None:
+            cache.save_export(export_key, output_path)
         
         QMessageBox.information(self, 'Export Complete', f'Exported to:\n{output_path}')
         self.statusBar().showMessage(f'Exported to: {output_path}')
@@ -1617,6 +2621,7 @@ First 10 faces:
 
 Total Files Cached: {stats['total_files']}
 Total Cache Size: {stats['total_size_mb']:.2f} MB
+Cached Exports: {stats['export_files']} ({stats['export_size_mb']:.2f} MB, last {cache.max_exports} kept)
 Cache Directory: {stats['cache_dir']}
 
 Cache entries are automatically cleaned up after 30 days of inactivity.
@@ -1657,44 +2662,45 @@ Maximum cache size is limited to 1 GB."""
     def restore_splitter_state(self):
         """Restore splitter sizes, zoom level, and theme from saved state"""
         try:
-            app_data_dir = self.get_app_data_dir()
-            settings_file = app_data_dir / "ui_settings.json"
+            settings_file = self.get_settings_file()
             if settings_file.exists():
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    
-                    # Restore theme first (needed for zoom styling)
-                    if 'theme' in settings and settings['theme'] in ['light', 'dark']:
-                        self.md3_theme = settings['theme']
-                        print(f"Restoring theme: {self.md3_theme}")
-                        # Apply theme without triggering toggle
-                        self.setStyleSheet(get_md3_stylesheet(self.md3_theme))
-                        self.md3_colors = get_md3_colors(self.md3_theme)
-                    
-                    # Restore zoom level after theme is set
-                    if 'zoom_level' in settings:
-                        saved_zoom = settings['zoom_level']
-                        print(f"Restoring zoom level: {saved_zoom}")
-                        self.current_zoom_index = saved_zoom
-                        # Ensure zoom level is valid
-                        if 0 <= self.current_zoom_index < len(self.zoom_levels):
-                            # Set zoom_scale before updating
-                            self.zoom_scale = self.zoom_levels[self.current_zoom_index]
-                            print(f"Setting zoom_scale to: {self.zoom_scale}")
-                            self.update_zoom()
-                            print(f"Zoom restoration completed")
-                        else:
-                            # Reset to default if invalid
-                            print(f"Invalid zoom level {saved_zoom}, resetting to default")
-                            self.current_zoom_index = 2
-                            self.zoom_scale = self.zoom_levels[self.current_zoom_index]
-                            self.update_zoom()
+                settings = json.loads(settings_file.read_bytes())
+                
+                # Restore theme first (needed for zoom styling)
+                if 'theme' in settings and settings['theme'] in ['light', 'dark']:
+                    self.md3_theme = settings['theme']
+                    print(f"Restoring theme: {self.md3_theme}")
+                    # Apply theme without triggering toggle
+                    self.setStyleSheet(get_md3_stylesheet(self.md3_theme))
+                    self.md3_colors = get_md3_colors(self.md3_theme)
+                
+                # Restore zoom level after theme is set
+                if 'zoom_level' in settings:
+                    saved_zoom = settings['zoom_level']
+                    print(f"Restoring zoom level: {saved_zoom}")
+                    self.current_zoom_index = saved_zoom
+                    # Ensure zoom level is valid
+                    if 0 <= self.current_zoom_index < len(self.zoom_levels):
+                        # Set zoom_scale before updating
+                        self.zoom_scale = self.zoom_levels[self.current_zoom_index]
+                        print(f"Setting zoom_scale to: {self.zoom_scale}")
+                        self.update_zoom()
+                        print(f"Zoom restoration completed")
                     else:
-                        print("No zoom level found in settings")
-                    
-                    # Restore splitter sizes last
-                    if 'splitter_sizes' in settings:
-                        self.splitter.setSizes(settings['splitter_sizes'])
+                        # Reset to default if invalid
+                        print(f"Invalid zoom level {saved_zoom}, resetting to default")
+                        self.current_zoom_index = 2
+                        self.zoom_scale = self.zoom_levels[self.current_zoom_index]
+                        self.update_zoom()
+                else:
+                    print("No zoom level found in settings")
+                
+                # Restore splitter sizes last
+                if 'splitter_sizes' in settings:
+                    self.splitter.setSizes(settings['splitter_sizes'])
+                
+                # The file already matches this state, so closing unchanged needs no write
+                self.last_saved_settings = self.current_ui_settings()
         except Exception as e:
             print(f"Could not restore UI state: {e}")
     
@@ -1729,21 +2735,35 @@ Maximum cache size is limited to 1 GB."""
         app_dir.mkdir(parents=True, exist_ok=True)
         return app_dir
     
+    def get_settings_file(self):
+        """Get the ui_settings.json path, resolving the app data directory only on first use"""
+        if self.settings_file is None:
+            self.settings_file = self.get_app_data_dir() / "ui_settings.json"
+        return self.settings_file
+    
+    def current_ui_settings(self):
+        """Return the UI state that is persisted to ui_settings.json"""
+        return {
+            'splitter_sizes': self.splitter.sizes(),
+            'zoom_level': self.current_zoom_index,
+            'theme': self.md3_theme
+        }
+    
     def save_splitter_state(self):
         """Save current splitter sizes and zoom level"""
         try:
-            app_data_dir = self.get_app_data_dir()
-            settings_file = app_data_dir / "ui_settings.json"
-            settings_file.parent.mkdir(parents=True, exist_ok=True)
+            settings = self.current_ui_settings()
+            if settings == self.last_saved_settings:
+                # Nothing changed since the last save or restore
+                return
             
-            settings = {
-                'splitter_sizes': self.splitter.sizes(),
-                'zoom_level': self.current_zoom_index,
-                'theme': self.md3_theme
-            }
+            settings_file = self.get_settings_file()
             
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            # Write a temporary file and swap it in, so a crash never leaves a truncated settings file
+            temp_file = settings_file.with_suffix('.tmp')
+            temp_file.write_bytes(json.dumps(settings, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+            os.replace(temp_file, settings_file)
+            self.last_saved_settings = settings
             print(f"Saved UI state: zoom={self.current_zoom_index}, theme={self.md3_theme}")
         except Exception as e:
             print(f"Could not save UI state: {e}")
@@ -1985,6 +3005,9 @@ Maximum cache size is limited to 1 GB."""
 
 
 def main():
+    if '--legacy-decimate' in sys.argv:
+        MeshSimplifier.use_legacy_decimation = True
+    
     app = QApplication(sys.argv)
     window = OBJProcessorApp()
     window.show()
@@ -8,12 +8,17 @@ import json
 import hashlib
 import pickle
 import time
+import shutil
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 
 class ModelCache:
     """Manages caching of preprocessed OBJ model data"""
     
+    # Cached exports beyond this count are dropped, least recently used first
+    max_exports = 20
+    
     def __init__(self, cache_dir=None):
         """Initialize cache system"""
         if cache_dir is None:
@@ -56,7 +61,19 @@ class ModelCache:
             print(f"Warning: Could not save cache index: {e}")
     
     def compute_file_hash(self, file_path):
-        """Compute SHA256 hash of file"""
+        """Compute SHA256 hash of file, reusing the indexed hash while its size and mtime are unchanged"""
+        try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            print(f"Error computing hash: {e}")
+            return None
+        
+        # Opening a cached model used to hash the whole file two or three times
+        cache_entry = self.cache_index.get(str(file_path))
+        if (cache_entry and cache_entry.get('size') == stat.st_size and
+                cache_entry.get('mtime_ns') == stat.st_mtime_ns):
+            return cache_entry['hash']
+        
         sha256 = hashlib.sha256()
         
         try:
@@ -73,6 +90,63 @@ class ModelCache:
         """Get cache file path for a given hash"""
         return self.cache_dir / f"{file_hash}.cache"
     
+    @staticmethod
+    def file_signature(file_path):
+        """Size and mtime stored with an index entry, so compute_file_hash can trust its hash"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return {}
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    
+    def get_export_path(self, export_key):
+        """Get cached export file path for a given export key"""
+        return self.cache_dir / f"{export_key}.export.obj"
+    
+    def load_export(self, export_key, output_path):
+        """Copy a previously generated export to output_path, returns False on a miss"""
+        export_path = self.get_export_path(export_key)
+        if not export_path.exists():
+            return False
+        
+        try:
+            shutil.copyfile(export_path, output_path)
+            # Touch so cleanup ages exports by last use
+            os.utime(export_path)
+            print(f"Export cache hit: {export_key}")
+            return True
+        except Exception as e:
+            print(f"Error loading cached export: {e}")
+            return False
+    
+    def save_export(self, export_key, exported_path):
+        """Keep a copy of a freshly written export under its key"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(exported_path, self.get_export_path(export_key))
+            
+            # Keep only the most recently used exports
+            for export_path, _, _ in self.get_export_files()[self.max_exports:]:
+                export_path.unlink(missing_ok=True)
+            return True
+        except Exception as e:
+            print(f"Error saving export to cache: {e}")
+            return False
+    
+    def get_export_files(self):
+        """Get (path, size in MB, last use time) of all cached exports, most recently used first"""
+        exports = []
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.export.obj') and entry.is_file():
+                        stat = entry.stat()
+                        exports.append((Path(entry.path), stat.st_size / (1024 * 1024), stat.st_mtime))
+        except OSError:
+            pass
+        exports.sort(key=lambda export: export[2], reverse=True)
+        return exports
+    
     def is_cached(self, file_path):
         """Check if file is cached and cache is valid (by hash, not path)"""
         file_path = str(file_path)
@@ -94,6 +168,7 @@ class ModelCache:
             self.cache_index[file_path] = {
                 'hash': file_hash,
                 'original_name': os.path.basename(file_path),
+                **self.file_signature(file_path),
                 'cached_at': time.time(),
                 'last_accessed': time.time(),
                 'processing_time': 0,  # Unknown for reused cache
@@ -170,6 +245,7 @@ class ModelCache:
             self.cache_index[file_path] = {
                 'hash': file_hash,
                 'original_name': os.path.basename(file_path),
+                **self.file_signature(file_path),
                 'cached_at': time.time(),
                 'last_accessed': time.time(),
                 'processing_time': processing_time,
@@ -192,6 +268,7 @@ class ModelCache:
             self.cache_index[file_path] = {
                 'hash': file_hash,
                 'original_name': os.path.basename(file_path),
+                **self.file_signature(file_path),
                 'cached_at': time.time(),
                 'last_accessed': time.time(),
                 'processing_time': processing_time,
@@ -232,9 +309,12 @@ class ModelCache:
                 self.save_index()
                 print(f"Cache cleared for: {os.path.basename(file_path)}")
         else:
-            # Clear all cache
-            for cache_file in self.cache_dir.glob("*.cache"):
-                cache_file.unlink()
+            # Clear all cache, one scandir pass and the unlinks overlapped on a few threads
+            with os.scandir(self.cache_dir) as entries:
+                cache_files = [entry.path for entry in entries
+                               if entry.name.endswith(('.cache', '.export.obj')) and entry.is_file()]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(os.unlink, cache_files))
             
             self.cache_index = {}
             self.save_index()
@@ -248,9 +328,15 @@ class ModelCache:
         for entry in self.cache_index.values():
             total_size += entry.get('cache_size_mb', 0)
         
+        # Cached exports are not indexed but take space in the same directory
+        exports = self.get_export_files()
+        export_size = sum(size for _, size, _ in exports)
+        
         return {
-            'total_files': total_files,
-            'total_size_mb': total_size,
+            'total_files': total_files + len(exports),
+            'total_size_mb': total_size + export_size,
+            'export_files': len(exports),
+            'export_size_mb': export_size,
             'cache_dir': str(self.cache_dir)
         }
     
@@ -259,33 +345,29 @@ class ModelCache:
         current_time = time.time()
         max_age_seconds = max_age_days * 24 * 3600
         
-        # Sort by last accessed time
-        sorted_entries = sorted(
-            self.cache_index.items(),
-            key=lambda x: x[1].get('last_accessed', 0)
-        )
+        # Model entries and cached exports share the size limit, newest first so
+        # the least recently used ones are the ones over the limit
+        entries = [(entry.get('last_accessed', 0), entry.get('cache_size_mb', 0), file_path, None)
+                   for file_path, entry in self.cache_index.items()]
+        entries.extend((last_used, size, None, export_path)
+                       for export_path, size, last_used in self.get_export_files())
+        entries.sort(key=lambda entry: entry[0], reverse=True)
         
         total_size = 0
         to_remove = []
         
-        for file_path, entry in sorted_entries:
-            age = current_time - entry.get('last_accessed', 0)
-            size = entry.get('cache_size_mb', 0)
-            
-            # Remove if too old
-            if age > max_age_seconds:
-                to_remove.append(file_path)
+        for last_used, size, file_path, export_path in entries:
+            # Remove if too old or if it would take the total over the size limit
+            if current_time - last_used <= max_age_seconds and total_size + size <= max_size_mb:
+                total_size += size
                 continue
-            
-            # Remove if total size exceeds limit
-            total_size += size
-            if total_size > max_size_mb:
+            if export_path is not None:
+                export_path.unlink(missing_ok=True)
+                to_remove.append(str(export_path))
+            else:
+                self.clear_cache(file_path)
                 to_remove.append(file_path)
         
-        # Remove marked entries
-        for file_path in to_remove:
-            self.clear_cache(file_path)
-        
         if to_remove:
             print(f"Cleaned up {len(to_remove)} old cache entries")
         
@@ -25,13 +25,11 @@ def analyze_and_group_objects(obj_file_path):
     # Analyze objects and their face counts
     objects_info = []
     for obj_name, obj_faces in parser.objects.items():
-        # Calculate unique vertices for this object
-        used_vertices = set()
-        for face in obj_faces:
-            for vertex_data in face:
-                parts = vertex_data.split('/')
-                if parts[0]:
-                    used_vertices.add(int(parts[0]) - 1)
+        # Calculate unique vertices for this object, converting each distinct
+        # vertex reference to an int once instead of splitting every corner token
+        vertex_refs = {vertex_data.partition('/')[0] for face in obj_faces for vertex_data in face}
+        vertex_refs.discard('')
+        used_vertices = set(map(int, vertex_refs))
         
         objects_info.append({
             'name': obj_name,
@@ -126,6 +124,34 @@ def export_grouped_objects(obj_file_path, object1_groups, object2_groups, output
     # Export Object 2  
     export_single_object(parser, object2_groups, obj_file_path, os.path.join(output_dir, "Object2.obj"), "Object2")
 
+def remap_corner(vertex_data, vertex_map, tex_coord_map, normal_map):
+    """Rewrite one 'v/vt/vn' face token with remapped indices"""
+    parts = vertex_data.split('/')
+    new_data = []
+    
+    if parts[0]:  # Vertex
+        new_data.append(str(vertex_map[int(parts[0]) - 1] + 1))
+    else:
+        new_data.append('')
+    
+    if len(parts) > 1:
+        if parts[1]:  # Texture coordinate
+            new_data.append(str(tex_coord_map[int(parts[1]) - 1] + 1))
+        else:
+            new_data.append('')
+    else:
+        new_data.append('')
+    
+    if len(parts) > 2:
+        if parts[2]:  # Normal
+            new_data.append(str(normal_map[int(parts[2]) - 1] + 1))
+        else:
+            new_data.append('')
+    else:
+        new_data.append('')
+    
+    return '/'.join(new_data)
+
 def export_single_object(parser, group_names, obj_file_path, output_path, object_name):
     """Export a single object composed of multiple groups"""
     
@@ -135,95 +161,73 @@ def export_single_object(parser, group_names, obj_file_path, output_path, object
     used_normals = set()
     used_tex_coords = set()
     
+    # Faces share most of their corner tokens, so the index guards below only run
+    # once per distinct token instead of once per face vertex
+    unique_tokens = set()
     for group_name in group_names:
         if group_name in parser.objects:
             group_faces = parser.objects[group_name]
             all_faces.extend(group_faces)
-            
-            # Find all vertices used by this group
             for face in group_faces:
-                for vertex_data in face:
-                    parts = vertex_data.split('/')
-                    if parts[0]:  # Vertex index
-                        used_vertices.add(int(parts[0]) - 1)
-                    if len(parts) > 1 and parts[1]:  # Texture coordinate
-                        used_tex_coords.add(int(parts[1]) - 1)
-                    if len(parts) > 2 and parts[2]:  # Normal
-                        used_normals.add(int(parts[2]) - 1)
+                unique_tokens.update(face)
+    
+    # Find all vertices used by these groups
+    for vertex_data in unique_tokens:
+        parts = vertex_data.split('/')
+        if parts[0]:  # Vertex index
+            used_vertices.add(int(parts[0]) - 1)
+        if len(parts) > 1 and parts[1]:  # Texture coordinate
+            used_tex_coords.add(int(parts[1]) - 1)
+        if len(parts) > 2 and parts[2]:  # Normal
+            used_normals.add(int(parts[2]) - 1)
+    
+    # Sort the used indices once, the maps and the output blocks share them
+    sorted_vertices = sorted(used_vertices)
+    sorted_normals = sorted(used_normals)
+    sorted_tex_coords = sorted(used_tex_coords)
     
     # Create remapped indices
-    vertex_map = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted(used_vertices))}
-    normal_map = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted(used_normals))}
-    tex_coord_map = {old_idx: new_idx for new_idx, old_idx in enumerate(sorted(used_tex_coords))}
-    
-    # Remap faces
-    remapped_faces = []
-    for face in all_faces:
-        remapped_face = []
-        for vertex_data in face:
-            parts = vertex_data.split('/')
-            new_data = []
-            
-            if parts[0]:  # Vertex
-                new_data.append(str(vertex_map[int(parts[0]) - 1] + 1))
-            else:
-                new_data.append('')
-            
-            if len(parts) > 1:
-                if parts[1]:  # Texture coordinate
-                    new_data.append(str(tex_coord_map[int(parts[1]) - 1] + 1))
-                else:
-                    new_data.append('')
-            else:
-                new_data.append('')
-            
-            if len(parts) > 2:
-                if parts[2]:  # Normal
-                    new_data.append(str(normal_map[int(parts[2]) - 1] + 1))
-                else:
-                    new_data.append('')
-            else:
-                new_data.append('')
-            
-            remapped_face.append('/'.join(new_data))
-        remapped_faces.append(remapped_face)
-    
-    # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
+    vertex_map = dict(zip(sorted_vertices, range(len(sorted_vertices))))
+    normal_map = dict(zip(sorted_normals, range(len(sorted_normals))))
+    tex_coord_map = dict(zip(sorted_tex_coords, range(len(sorted_tex_coords))))
+    
+    # Remap each distinct token once, then faces are a plain lookup per vertex
+    token_map = {vertex_data: remap_corner(vertex_data, vertex_map, tex_coord_map, normal_map)
+                 for vertex_data in unique_tokens}
+    remapped_faces = [[token_map[vertex_data] for vertex_data in face] for face in all_faces]
+    
+    # Write to file, each block is built as one string and goes out through a 1 MB buffer
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
         f.write(f"# Exported from: {obj_file_path}\n")
         f.write(f"# Main Object: {object_name}\n")
         f.write(f"# Groups: {', '.join(group_names)}\n")
-        f.write(f"# Vertices: {len(sorted(used_vertices))}\n")
+        f.write(f"# Vertices: {len(used_vertices)}\n")
         f.write(f"# Faces: {len(remapped_faces)}\n\n")
         
         # Write vertices
-        for i in sorted(used_vertices):
-            v = parser.vertices[i]
-            f.write(f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n")
+        vertices = parser.vertices
+        f.write("".join([f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n" for v in map(vertices.__getitem__, sorted_vertices)]))
         
         # Write texture coordinates if any
         if used_tex_coords:
             f.write("\n")
-            for i in sorted(used_tex_coords):
-                vt = parser.texture_coords[i]
-                f.write(f"vt {vt[0]:.6f} {vt[1]:.6f}\n")
+            texture_coords = parser.texture_coords
+            f.write("".join([f"vt {vt[0]:.6f} {vt[1]:.6f}\n" for vt in map(texture_coords.__getitem__, sorted_tex_coords)]))
         
         # Write normals if any
         if used_normals:
             f.write("\n")
-            for i in sorted(used_normals):
-                vn = parser.normals[i]
-                f.write(f"vn {vn[0]:.6f} {vn[1]:.6f} {vn[2]:.6f}\n")
+            normals = parser.normals
+            f.write("".join([f"vn {vn[0]:.6f} {vn[1]:.6f} {vn[2]:.6f}\n" for vn in map(normals.__getitem__, sorted_normals)]))
         
         # Write faces
         f.write("\n")
         f.write(f"o {object_name}\n")
-        for face in remapped_faces:
-            f.write(f"f {' '.join(face)}\n")
+        f.write("".join(["f " + " ".join(face) + "\n" for face in remapped_faces]))
     
     print(f"Exported {object_name} to: {output_path}")
     print(f"  Groups: {', '.join(group_names)}")
-    print(f"  Vertices: {len(sorted(used_vertices))}")
+    print(f"  Vertices: {len(used_vertices)}")
     print(f"  Faces: {len(remapped_faces)}")
 
 def main():
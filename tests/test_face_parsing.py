@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('numba')
+pytest.importorskip('PyQt6')
+pytest.importorskip('OpenGL')
+
+import main
+
+MALFORMED_OBJ = """v 0 0 0
+v 1 0 0
+v 0 1 0
+v 1 1 0
+vt 0 0
+vn 0 0 1
+o part
+f 1 2 3 #c
+f 2/1/1 4/1/1 3/x/1
+f 1 2a 4 -
+f 1/1/1/9 2//1 3
+"""
+
+# \v and \f are read by the kernel, NBSP and \x1c send their object to the Python tokenizer
+SEPARATOR_OBJ = """v 0 0 0
+v 1 0 0
+v 0 1 0
+v 1 1 0
+o ascii
+f 1 2\x0b3 4
+f 1\x0c2 3
+f 1 2 \x0b\x0c 4
+o unicode
+f 1 2\xa03 4
+f 1\u20032 3
+f 1\x1c2 4
+"""
+
+
+def parse(path):
+    parser = main.OBJParser()
+    assert parser.parse_file(str(path))
+    return parser
+
+
+def parse_both_ways(path, monkeypatch):
+    """Parse a file with the numba face kernel and with the pure-Python fallback"""
+    assert main.get_numba_kernel(main.parse_face_corners)
+    compiled = parse(path)
+    
+    monkeypatch.setitem(main.NUMBA_KERNELS, main.parse_face_corners, False)
+    python = parse(path)
+    
+    assert compiled.objects == python.objects
+    assert compiled.face_corners.keys() == python.face_corners.keys()
+    for name in compiled.face_corners:
+        for compiled_refs, python_refs in zip(compiled.face_corners[name], python.face_corners[name]):
+            assert np.array_equal(compiled_refs, python_refs)
+        assert np.array_equal(compiled.triangulated[name], python.triangulated[name])
+    return compiled
+
+
+def test_malformed_face_tokens_parse_the_same_with_and_without_numba(tmp_path, monkeypatch):
+    path = tmp_path / 'malformed.obj'
+    path.write_text(MALFORMED_OBJ)
+    
+    parser = parse_both_ways(path, monkeypatch)
+    assert parser.face_corners.keys() == {'part'}
+
+
+def test_whitespace_separators_parse_the_same_with_and_without_numba(tmp_path, monkeypatch):
+    path = tmp_path / 'separators.obj'
+    path.write_text(SEPARATOR_OBJ, encoding='utf-8')
+    
+    parser = parse_both_ways(path, monkeypatch)
+    for name in ('ascii', 'unicode'):
+        face_sizes, v_refs, _, _ = parser.face_corners[name]
+        assert face_sizes.tolist() == [4, 3, 3]
+        assert v_refs.tolist() == [0, 1, 2, 3, 0, 1, 2, 0, 1, 3]
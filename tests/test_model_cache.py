@@ -0,0 +1,44 @@
+import os
+import time
+
+from model_cache import ModelCache
+
+
+def write_export(cache, key, size, age):
+    """Put a cached export of size bytes, last used age seconds ago"""
+    path = cache.get_export_path(key)
+    path.write_bytes(b'v 0 0 0\n' * (size // 8))
+    last_used = time.time() - age
+    os.utime(path, (last_used, last_used))
+    return path
+
+
+def test_cache_stats_count_exports(tmp_path):
+    cache = ModelCache(tmp_path)
+    write_export(cache, 'a', 1024 * 1024, 0)
+    
+    stats = cache.get_cache_stats()
+    assert stats['export_files'] == 1
+    assert stats['total_files'] == 1
+    assert abs(stats['total_size_mb'] - 1.0) < 1e-6
+
+
+def test_save_export_keeps_most_recent(tmp_path):
+    cache = ModelCache(tmp_path)
+    cache.max_exports = 2
+    for i, key in enumerate(('old', 'mid')):
+        write_export(cache, key, 64, 100 - i)
+    source = tmp_path / 'fresh.obj'
+    source.write_bytes(b'v 0 0 0\n')
+    
+    assert cache.save_export('new', source)
+    assert sorted(path.name for path, _, _ in cache.get_export_files()) == ['mid.export.obj', 'new.export.obj']
+
+
+def test_cleanup_evicts_least_recent_exports_over_size_limit(tmp_path):
+    cache = ModelCache(tmp_path)
+    old = write_export(cache, 'old', 1024 * 1024, 200)
+    new = write_export(cache, 'new', 1024 * 1024, 100)
+    
+    assert cache.cleanup_old_cache(max_age_days=30, max_size_mb=1.5) == 1
+    assert new.exists() and not old.exists()
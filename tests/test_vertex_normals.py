@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('numba')
+pytest.importorskip('PyQt6')
+pytest.importorskip('OpenGL')
+
+import main
+
+
+def torus_mesh(rings=24, sides=16, major=1.0, minor=0.3):
+    """Vertices and triangles of a torus"""
+    u = np.linspace(0, 2 * np.pi, rings, endpoint=False)[:, None]
+    v = np.linspace(0, 2 * np.pi, sides, endpoint=False)[None, :]
+    vertices = np.stack(((major + minor * np.cos(v)) * np.cos(u),
+                         (major + minor * np.cos(v)) * np.sin(u),
+                         np.broadcast_to(minor * np.sin(v), (rings, sides))), axis=-1).reshape(-1, 3)
+    i, j = np.meshgrid(np.arange(rings), np.arange(sides), indexing='ij')
+    a = i * sides + j
+    b = (i + 1) % rings * sides + j
+    c = (i + 1) % rings * sides + (j + 1) % sides
+    d = i * sides + (j + 1) % sides
+    triangles = np.concatenate((np.stack((a, b, c), axis=-1).reshape(-1, 3),
+                                np.stack((a, c, d), axis=-1).reshape(-1, 3)))
+    return vertices.astype(np.float32), triangles.astype(np.intc)
+
+
+def test_normals_kernel_matches_numpy_with_degenerate_triangles(monkeypatch):
+    vertices, triangles = torus_mesh()
+    # Triangles whose last two corners share an index, as weld_vertices produces them
+    degenerate = np.array([[7, 8, 8], [40, 41, 41], [100, 3, 3]], dtype=np.intc)
+    triangles = np.concatenate((triangles, degenerate))
+    
+    kernel = main.get_numba_kernel(main.accumulate_vertex_normals)
+    assert kernel
+    _, kernel_normals, _, _ = main.OBJViewer.create_gpu_buffers(vertices, triangles)
+    
+    monkeypatch.setitem(main.NUMBA_KERNELS, main.accumulate_vertex_normals, False)
+    _, numpy_normals, _, _ = main.OBJViewer.create_gpu_buffers(vertices, triangles)
+    
+    # Normals are packed to int16, allow one step of rounding difference
+    assert np.abs(kernel_normals.astype(np.int32) - numpy_normals.astype(np.int32)).max() <= 1